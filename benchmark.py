@@ -0,0 +1,396 @@
+"""Micro-benchmarks for the password generation engines.
+
+Run from the repository root:
+
+    python3 benchmark.py
+"""
+import asyncio
+import os
+import re
+import time
+import timeit
+import tracemalloc
+
+from password_generator import (AsyncPasswordGenerator, BitStreamSampler, BulkGenerator, Charset, HashDRBG,
+                                PasswordGenerator, PasswordPolicy, PasswordRegex, RandomBytePool,
+                                ShakeDRBG)
+
+LENGTHS = (6, 8, 12, 16, 24, 32, 48, 64)  # Spans the 6-64 range the slider allows
+ALL_CLASSES = (True, True, True, True)
+
+
+def _time_per_call(func, number: int) -> float:
+    """Returns the best-of-five time per call in microseconds."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def bench_engines(number: int = 2000):
+    """Compares the per-character secrets.choice path with the bulk engines."""
+    engines = ("choice", "bytes", "bigint")
+    print("Engine comparison (us per password, all character classes; speedup vs choice)")
+    print(f"{'length':>6} " + " ".join(f"{engine:>16}" for engine in engines))
+    for length in LENGTHS:
+        timings = [
+            _time_per_call(lambda: PasswordGenerator.generate(length, *ALL_CLASSES, engine=engine), number)
+            for engine in engines
+        ]
+        cells = [f"{t:>8.2f} ({timings[0] / t:>4.1f}x)" for t in timings]
+        print(f"{length:>6} " + " ".join(f"{cell:>16}" for cell in cells))
+    print()
+
+
+def _throughput(func, count: int) -> float:
+    """Returns passwords per second for a call producing `count` passwords."""
+    start = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - start)
+
+
+def bench_batch(count: int = 200_000, length: int = 16):
+    """Compares a generate() loop with generate_many() in passwords per second."""
+    print(f"Batch throughput ({count:,} passwords of length {length})")
+    loop = _throughput(lambda: [PasswordGenerator.generate(length, *ALL_CLASSES) for _ in range(count)], count)
+    print(f"{'generate loop':>20} {loop:>14,.0f} /s")
+    for engine in ("bytes", "numpy"):
+        batch = _throughput(lambda: PasswordGenerator.generate_many(count, length, engine=engine), count)
+        print(f"{'generate_many/' + engine:>20} {batch:>14,.0f} /s")
+    policy = PasswordPolicy(length)
+    packed = _throughput(lambda: PasswordGenerator.generate_batch(count, policy), count)
+    print(f"{'generate_batch':>20} {packed:>14,.0f} /s")
+
+    tracemalloc.start()
+    passwords = PasswordGenerator.generate_many(count, length)
+    list_bytes = tracemalloc.get_traced_memory()[0]
+    del passwords
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    batch = PasswordGenerator.generate_batch(count, policy)
+    batch_bytes = tracemalloc.get_traced_memory()[0] - base
+    del batch
+    tracemalloc.stop()
+    print(f"{'memory list[str]':>20} {list_bytes / 1e6:>14,.1f} MB")
+    print(f"{'memory PasswordBatch':>20} {batch_bytes / 1e6:>14,.1f} MB")
+    print()
+
+
+def bench_sources(number: int = 20000, length: int = 16, count: int = 200_000):
+    """Compares randomness sources for single passwords and for batches (bytes engine)."""
+    print(f"Randomness sources (length {length}, bytes engine)")
+    choice = _throughput(lambda: [PasswordGenerator.generate(length, *ALL_CLASSES) for _ in range(number)], number)
+    print(f"Baseline secrets.choice loop: {choice:,.0f} /s")
+    print(f"{'source':>20} {'us/password':>12} {'batch /s':>14}")
+    sources = {
+        "os.urandom": None,
+        "RandomBytePool": RandomBytePool(),
+        "ShakeDRBG": ShakeDRBG(),
+        "HashDRBG/sha256": HashDRBG("sha256"),
+        "HashDRBG/sha512": HashDRBG("sha512"),
+    }
+    for name, source in sources.items():
+        per_call = _time_per_call(
+            lambda: PasswordGenerator.generate(length, *ALL_CLASSES, engine="bytes", source=source), number)
+        batch = _throughput(lambda: PasswordGenerator.generate_many(count, length, source=source), count)
+        print(f"{name:>20} {per_call:>12.2f} {batch:>14,.0f}")
+    print()
+
+
+class _CountingSource:
+    """Randomness source that records how many bytes were requested from os.urandom."""
+
+    def __init__(self):
+        self.consumed = 0
+
+    def read(self, n: int) -> bytes:
+        self.consumed += n
+        return os.urandom(n)
+
+
+def bench_entropy(count: int = 5000):
+    """Reports random bytes consumed per password by each engine (all character classes)."""
+    engines = ("bytes", "bigint", "bits")
+    print(f"Randomness consumed (bytes per password, averaged over {count:,})")
+    print(f"{'length':>6} " + " ".join(f"{engine:>8}" for engine in engines) + f" {'minimum':>8}")
+    charset = Charset.from_options(*ALL_CLASSES)
+    for length in LENGTHS:
+        cells = []
+        for engine in engines:
+            source = _CountingSource()
+            if engine == "bits":
+                # Reuse one sampler so recycled bits carry over between passwords, as in bulk jobs
+                sampler = BitStreamSampler(source)
+                for _ in range(count):
+                    sampler.sample(charset, length)
+                consumed = sampler.bits_consumed / 8
+            else:
+                for _ in range(count):
+                    PasswordGenerator.generate(length, *ALL_CLASSES, engine=engine, source=source)
+                consumed = source.consumed
+            cells.append(f"{consumed / count:>8.2f}")
+        minimum = length * charset.bits_per_char / 8
+        print(f"{length:>6} " + " ".join(cells) + f" {minimum:>8.2f}")
+    print()
+
+
+def bench_parallel(count: int = 2_000_000):
+    """Compares single-process generate_many with the process-pool BulkGenerator.
+
+    Covers an 8-digit PIN policy and a 64-character full-alphabet policy, and
+    shows the chunk size the autotuner calibrated for each.
+    """
+    bulk = BulkGenerator()
+    policies = {"8-digit PIN": (8, (False, False, True, False)), "64-char secret": (64, ALL_CLASSES)}
+    print(f"Parallel bulk generation ({count:,} passwords, {bulk.workers} workers)")
+    print(f"{'policy':>16} {'generate_many /s':>18} {'BulkGenerator /s':>18} {'calibrated':>11} {'chunks':>7}")
+    for name, (length, options) in policies.items():
+        single = _throughput(lambda: PasswordGenerator.generate_many(count, length, *options), count)
+        parallel = _throughput(lambda: bulk.generate(count, length, *options), count)
+        stats = bulk.last_stats
+        print(f"{name:>16} {single:>18,.0f} {parallel:>18,.0f} "
+              f"{stats.calibrated_chunk_size:>11,} {len(stats.chunk_sizes):>7}")
+    print()
+
+
+def bench_affinity(count: int = 2_000_000, length: int = 16):
+    """Reports unpinned vs pinned process-pool throughput and the per-core breakdown."""
+    print(f"Worker placement ({count:,} passwords of length {length})")
+    for pin in (False, True):
+        bulk = BulkGenerator(pin_workers=pin)
+        rate = _throughput(lambda: bulk.generate(count, length), count)
+        label = "pinned" if pin else "unpinned"
+        print(f"{label:>20} {rate:>14,.0f} /s  ({bulk.workers} workers)")
+        if pin:
+            for cpu, cpu_rate in sorted(bulk.last_stats.cpu_throughput.items()):
+                print(f"{f'cpu {cpu}':>20} {cpu_rate:>14,.0f} /s busy")
+    print()
+
+
+def bench_shared(count: int = 2_000_000, length: int = 16):
+    """Compares pickled results with the shared-memory transport of BulkGenerator."""
+    bulk = BulkGenerator()
+    print(f"Result transport ({count:,} passwords of length {length}, {bulk.workers} workers)")
+    pickled = _throughput(lambda: bulk.generate(count, length), count)
+    print(f"{'pickled list':>20} {pickled:>14,.0f} /s")
+    batches = []
+    shared = _throughput(lambda: batches.append(bulk.generate_shared(count, length)), count)
+    print(f"{'shared memory':>20} {shared:>14,.0f} /s")
+    for batch in batches:
+        batch.close()
+    print()
+
+
+def bench_threads(count: int = 2_000_000, length: int = 16):
+    """Shows how the thread backend scales with worker count for different sources."""
+    print(f"Thread backend scaling ({count:,} passwords of length {length}, passwords per second)")
+    worker_counts = (1, 2, 4, 8)
+    print(f"{'source':>20} " + " ".join(f"{f'{w} thr':>12}" for w in worker_counts))
+    sources = {"os.urandom": lambda: None, "ShakeDRBG": ShakeDRBG}
+    for name, make_source in sources.items():
+        cells = []
+        for workers in worker_counts:
+            bulk = BulkGenerator(workers=workers, backend="thread")
+            source = make_source()
+            cells.append(_throughput(lambda: bulk.generate(count, length, source=source), count))
+        print(f"{name:>20} " + " ".join(f"{cell:>12,.0f}" for cell in cells))
+    print()
+
+
+def _covers_all_classes(password: str) -> bool:
+    return (any(c.isupper() for c in password) and any(c.islower() for c in password)
+            and any(c.isdigit() for c in password) and any(not c.isalnum() for c in password))
+
+
+def bench_coverage(count: int = 20_000):
+    """Compares regenerate-until-valid with the coverage-guaranteed policy (all four classes)."""
+    print(f"Class coverage ({count:,} passwords; us per password, attempts per password)")
+    print(f"{'length':>6} {'retry loop':>12} {'attempts':>9} {'guaranteed':>12} {'attempts':>9}")
+    for length in (6, 8, 12, 16):
+        attempts = 0
+
+        def retry_loop():
+            nonlocal attempts
+            for _ in range(count):
+                while True:
+                    attempts += 1
+                    if _covers_all_classes(PasswordGenerator.generate(length, *ALL_CLASSES, engine="bytes")):
+                        break
+
+        retry = 1e6 / _throughput(retry_loop, count)
+        policy = PasswordPolicy(length, require_each_class=True)
+        guaranteed = 1e6 / _throughput(lambda: PasswordGenerator.generate_batch(count, policy), count)
+        print(f"{length:>6} {retry:>12.2f} {attempts / count:>9.2f} {guaranteed:>12.2f} {1:>9.2f}")
+    print()
+
+
+def bench_quotas(count: int = 5_000, length: int = 12):
+    """Compares post-filtering generate_many output with exact composition quotas."""
+    print(f"Composition quotas ({count:,} passwords of length {length}; us per password, draws per password)")
+    print(f"{'quota':>24} {'post-filter':>12} {'draws':>9} {'quota':>12}")
+    cases = {
+        "3 digits, 2 symbols": {"numbers": 3, "symbols": 2},
+        "4 digits": {"numbers": 4},
+        "1-2 symbols, 0 upper": {"symbols": (1, 2), "upper": 0},
+    }
+    for name, quotas in cases.items():
+        policy = PasswordPolicy(length, quotas=quotas)
+        alphabets = dict(policy.classes)
+        ranges = [(low, high, alphabets[cls].alphabet) for cls, low, high in policy.quotas]
+        draws = 0
+
+        def post_filter():
+            nonlocal draws
+            accepted = 0
+            while accepted < count:
+                candidates = PasswordGenerator.generate_many(count, length)
+                draws += count
+                for password in candidates:
+                    if all(low <= sum(c in alphabet for c in password) <= high for low, high, alphabet in ranges):
+                        accepted += 1
+
+        filtered = 1e6 / _throughput(post_filter, count)
+        exact = 1e6 / _throughput(lambda: PasswordGenerator.generate_batch(count, policy), count)
+        print(f"{name:>24} {filtered:>12.2f} {draws / count:>9.1f} {exact:>12.2f}")
+    print()
+
+
+def bench_templates(count: int = 50_000):
+    """Compares per-segment generate() concatenation with compiled templates."""
+    segments = [(1, (True, False, False, False)), (3, (False, True, False, False)), "-",
+                (4, (False, False, True, False)), "-", (4, (False, False, False, True))]
+
+    def concatenate():
+        for _ in range(count):
+            "".join(part if isinstance(part, str) else PasswordGenerator.generate(part[0], *part[1], engine="bytes")
+                    for part in segments)
+
+    print(f'Templates ({count:,} passwords of "Aaaa-9999-ssss"; passwords per second)')
+    print(f"{'segment concatenation':>24} {_throughput(concatenate, count):>14,.0f} /s")
+    single = _throughput(lambda: [PasswordGenerator.generate_from_template("Aaaa-9999-ssss") for _ in range(count)],
+                         count)
+    print(f"{'generate_from_template':>24} {single:>14,.0f} /s")
+    bulk = _throughput(lambda: PasswordGenerator.generate_many_from_template(count, "Aaaa-9999-ssss"), count)
+    print(f"{'generate_many_from_...':>24} {bulk:>14,.0f} /s")
+    print()
+
+
+def bench_regex(count: int = 20_000):
+    """Compares generate-and-fullmatch rejection with DFA-guided regex generation."""
+    cases = {
+        r"\w*\d\w*": 8,
+        r"[A-Z][a-z]{3,6}\d{2,4}[!@#$%^&*]": 12,
+        r"(?:[a-z]{4}-){3}\d{2}": 17,
+    }
+    print(f"Regex-constrained generation ({count:,} passwords; us per password)")
+    print(f"{'pattern':>36} {'length':>6} {'compile ms':>10} {'DFA':>10} {'rejection':>10} {'attempts':>12}")
+    for pattern, length in cases.items():
+        start = time.perf_counter()
+        compiled = PasswordRegex(pattern)
+        compiled.count(length)
+        compile_ms = (time.perf_counter() - start) * 1000
+        PasswordRegex.compile(pattern)
+        dfa = 1e6 / _throughput(lambda: PasswordGenerator.generate_many_matching(count, pattern, length), count)
+        attempts = len(Charset.from_options(*ALL_CLASSES).alphabet) ** length / compiled.count(length)
+        if attempts < 100:
+            matcher = re.compile(pattern)
+
+            def rejection():
+                for _ in range(count):
+                    while not matcher.fullmatch(PasswordGenerator.generate(length, *ALL_CLASSES, engine="bytes")):
+                        pass
+
+            rejected = f"{1e6 / _throughput(rejection, count):>10.2f}"
+        else:
+            rejected = f"{'-':>10}"
+        print(f"{pattern:>36} {length:>6} {compile_ms:>10.2f} {dfa:>10.2f} {rejected} {attempts:>12.3g}")
+    print()
+
+
+def _char_class(char: str) -> tuple[bool, bool, bool]:
+    return char.isupper(), char.islower(), char.isdigit()
+
+
+def _within_run_limits(password: str, max_repeat: int, max_sequence: int) -> bool:
+    # Same rule as PasswordPolicy.max_sequence: a run is ASCII-consecutive characters of one class
+    repeat = run = 1
+    for previous, char in zip(password, password[1:]):
+        repeat = repeat + 1 if char == previous else 1
+        ascending = ord(char) == ord(previous) + 1 and _char_class(char) == _char_class(previous)
+        run = run + 1 if ascending else 1
+        if repeat > max_repeat or run > max_sequence:
+            return False
+    return True
+
+
+def bench_runs(count: int = 5_000):
+    """Compares rejection sampling with the repeat/sequence automaton (no repeats, no runs of 3+)."""
+    cases = {"PIN": (False, False, True, False), "all classes": ALL_CLASSES}
+    print(f"Repeat and sequence limits ({count:,} passwords; us per password)")
+    print(f"{'alphabet':>12} {'length':>6} {'rejection':>10} {'attempts':>9} {'automaton':>10}")
+    for name, options in cases.items():
+        for length in (8, 16, 32, 64):
+            attempts = 0
+
+            def rejection():
+                nonlocal attempts
+                for _ in range(count):
+                    while True:
+                        attempts += 1
+                        if _within_run_limits(PasswordGenerator.generate(length, *options, engine="bytes"), 1, 2):
+                            break
+
+            rejected = 1e6 / _throughput(rejection, count)
+            policy = PasswordPolicy(length, *options, max_repeat=1, max_sequence=2)
+            PasswordGenerator.generate_batch(1, policy)  # Build the cached count tables outside the timing
+            automaton = 1e6 / _throughput(lambda: PasswordGenerator.generate_batch(count, policy), count)
+            print(f"{name:>12} {length:>6} {rejected:>10.2f} {attempts / count:>9.2f} {automaton:>10.2f}")
+    print()
+
+
+def bench_async_lag(count: int = 2_000_000, tick: float = 0.001, budget_ms: float = 20.0):
+    """Measures event-loop lag while AsyncPasswordGenerator serves a bulk request.
+
+    A ticker coroutine sleeps for `tick` seconds in a loop and records how
+    late it wakes up; the p99 lateness must stay within `budget_ms`.
+    """
+    async def run():
+        generator = AsyncPasswordGenerator()
+        lags = []
+
+        async def ticker():
+            while True:
+                start = time.perf_counter()
+                await asyncio.sleep(tick)
+                lags.append(time.perf_counter() - start - tick)
+
+        ticker_task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        await generator.generate_many(count)
+        elapsed = time.perf_counter() - start
+        small = await asyncio.gather(*(generator.generate() for _ in range(10_000)))
+        ticker_task.cancel()
+        return lags, elapsed, len(small)
+
+    lags, elapsed, coalesced = asyncio.run(run())
+    lags.sort()
+    p99 = lags[int(len(lags) * 0.99)] * 1000
+    print(f"Async event-loop lag ({count:,} passwords in {elapsed:.2f}s, {coalesced:,} coalesced requests)")
+    print(f"{'p50':>20} {lags[len(lags) // 2] * 1000:>10.2f} ms")
+    print(f"{'p99':>20} {p99:>10.2f} ms  ({'within' if p99 <= budget_ms else 'OVER'} {budget_ms:.0f} ms budget)")
+    print()
+
+
+if __name__ == "__main__":
+    bench_engines()
+    bench_batch()
+    bench_sources()
+    bench_entropy()
+    bench_parallel()
+    bench_affinity()
+    bench_shared()
+    bench_threads()
+    bench_coverage()
+    bench_quotas()
+    bench_templates()
+    bench_regex()
+    bench_runs()
+    bench_async_lag()
@@ -0,0 +1 @@
+"""Lets `pytest` import the top-level modules when run from the repository root."""
@@ -1,27 +1,63 @@
-
-import sys
+import asyncio
+import os
 import secrets
 import string
 import math
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-                             QProgressBar, QCheckBox, QSlider, QFrame)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QClipboard, QAction
+import multiprocessing
+import hashlib
+import pickle
+import threading
+import time
+import weakref
+from array import array
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from functools import lru_cache
+from typing import AsyncIterator, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the "numpy" engine falls back to "bytes"
+    np = None
 
 # -----------------------------------------------------------------------------
 # Business Logic (Model)
 # -----------------------------------------------------------------------------
 
-class PasswordGenerator:
-    """Handles the logic of password generation and strength estimation."""
+@dataclass(frozen=True)
+class Charset:
+    """An immutable, precompiled alphabet shared by every generation and strength path.
 
-    @staticmethod
-    def generate(length: int, use_upper: bool, use_lower: bool, use_numbers: bool, use_symbols: bool) -> str:
-        """Generates a cryptographically secure random password."""
-        if not any([use_upper, use_lower, use_numbers, use_symbols]):
-            return ""
+    Use `Charset.from_options` rather than the constructor so that each option
+    combination is compiled once and served from a bounded cache.
+    """
+    alphabet: str
+    data: bytes = field(init=False, repr=False, compare=False)
+    size: int = field(init=False, compare=False)
+    threshold: int = field(init=False, repr=False, compare=False)   # Largest multiple of `size` that fits in a byte
+    table: bytes = field(init=False, repr=False, compare=False)     # bytes.translate table: byte -> alphabet[byte % size]
+    rejected: bytes = field(init=False, repr=False, compare=False)  # Bytes >= threshold, deleted during translation
+    bits_per_char: float = field(init=False, compare=False)
 
+    def __post_init__(self):
+        size = len(self.alphabet)
+        threshold = 256 - 256 % size if size else 0
+        table = bytes(ord(self.alphabet[b % size]) for b in range(256)) if size else bytes(256)
+        object.__setattr__(self, "data", self.alphabet.encode("ascii"))
+        object.__setattr__(self, "size", size)
+        object.__setattr__(self, "threshold", threshold)
+        object.__setattr__(self, "table", table)
+        object.__setattr__(self, "rejected", bytes(range(threshold, 256)))
+        object.__setattr__(self, "bits_per_char", math.log2(size) if size else 0.0)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def from_options(use_upper: bool, use_lower: bool, use_numbers: bool, use_symbols: bool) -> "Charset":
+        """Returns the compiled charset for a checkbox combination (16 at most)."""
         alphabet = ""
         if use_upper:
             alphabet += string.ascii_uppercase
@@ -31,8 +67,1507 @@ class PasswordGenerator:
             alphabet += string.digits
         if use_symbols:
             alphabet += string.punctuation
+        return Charset(alphabet)
+
+
+# Character class name -> Charset.from_options flags selecting only that class
+_CLASS_OPTIONS = {
+    "upper": (True, False, False, False),
+    "lower": (False, True, False, False),
+    "numbers": (False, False, True, False),
+    "symbols": (False, False, False, True),
+}
+
+
+@dataclass(frozen=True)
+class PasswordPolicy:
+    """What to generate: length, character classes and sampling engine.
+
+    With `require_each_class` every selected class appears at least once.
+    `quotas` maps class names ("upper", "lower", "numbers", "symbols") to an
+    exact count or an inclusive (min, max) range, e.g. {"numbers": 3,
+    "symbols": (1, 2)}; it is stored as sorted (name, min, max) tuples so the
+    policy stays hashable. `max_repeat` caps how often a character may repeat
+    in a row and `max_sequence` caps runs of ASCII-consecutive characters of
+    one class (2 rejects "abc", "123" and "#$%", but not "Z[" or "/:"). Passwords stay uniform over all compliant ones.
+    """
+    length: int = 16
+    use_upper: bool = True
+    use_lower: bool = True
+    use_numbers: bool = True
+    use_symbols: bool = True
+    engine: str = "bytes"
+    require_each_class: bool = False
+    quotas: tuple[tuple[str, int, int], ...] = ()
+    max_repeat: int | None = None
+    max_sequence: int | None = None
+
+    def __post_init__(self):
+        if self.length < 0:
+            raise ValueError("length must not be negative")
+        if self.engine not in _SAMPLERS:
+            raise ValueError(f"Unknown engine: {self.engine!r}")
+        object.__setattr__(self, "quotas", self._normalize_quotas(self.quotas))
+        for name in ("max_repeat", "max_sequence"):
+            limit = getattr(self, name)
+            if limit is not None and limit < 1:
+                raise ValueError(f"{name} must be at least 1")
+        if (self.max_repeat is not None or self.max_sequence is not None) and self.class_bounds is not None:
+            raise ValueError("max_repeat and max_sequence cannot be combined with class requirements")
+
+    def _normalize_quotas(self, quotas) -> tuple[tuple[str, int, int], ...]:
+        items = quotas.items() if isinstance(quotas, dict) else ((q[0], q[1:]) for q in quotas)
+        ranges = {}
+        for name, count in items:
+            if name not in _CLASS_OPTIONS:
+                raise ValueError(f"Unknown character class: {name!r}")
+            if isinstance(count, int):
+                low = high = count
+            else:
+                low, high = (count[0], count[0]) if len(count) == 1 else count
+            if not 0 <= low <= high:
+                raise ValueError(f"Invalid quota for {name!r}: {count!r}")
+            if low and not getattr(self, "use_" + name):
+                raise ValueError(f"Quota requires {name!r}, which is not selected")
+            ranges[name] = (low, high)
+        return tuple((name, *ranges[name]) for name in _CLASS_OPTIONS if name in ranges)
+
+    @property
+    def charset(self) -> Charset:
+        return Charset.from_options(self.use_upper, self.use_lower, self.use_numbers, self.use_symbols)
+
+    @property
+    def classes(self) -> tuple[tuple[str, Charset], ...]:
+        """The selected character classes as (name, single-class charset) pairs."""
+        flags = (self.use_upper, self.use_lower, self.use_numbers, self.use_symbols)
+        return tuple((name, Charset.from_options(*options))
+                     for (name, options), selected in zip(_CLASS_OPTIONS.items(), flags) if selected)
+
+    @property
+    def class_bounds(self) -> tuple[tuple[int, int], ...] | None:
+        """Inclusive per-class count ranges aligned with `classes`, or None when unconstrained."""
+        if not (self.require_each_class or self.quotas):
+            return None
+        quotas = {name: (low, high) for name, low, high in self.quotas}
+        floor = 1 if self.require_each_class else 0
+        bounds = []
+        for name, _ in self.classes:
+            low, high = quotas.get(name, (0, self.length))
+            bounds.append((max(low, floor), min(high, self.length)))
+        return tuple(bounds)
+
+
+# Objects holding buffered randomness; each is reset in the child after os.fork()
+_FORK_SENSITIVE = weakref.WeakSet()
+
+
+def _reset_after_fork():
+    for obj in list(_FORK_SENSITIVE):
+        obj._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class _PoolBuffer:
+    """A single thread's prefetched block; see `RandomBytePool`."""
+
+    def __init__(self, block_size: int, low_water: int):
+        self.block_size = block_size
+        self.low_water = low_water
+        self._buffer = bytearray(block_size)
+        self._view = memoryview(self._buffer)
+        self._pos = block_size   # Start empty; the first read triggers a refill
+        self._handed_out = 0     # Start of the region returned by the previous read
+
+    def read(self, n: int) -> memoryview:
+        start, pos = self._handed_out, self._pos
+        if start < pos:
+            self._buffer[start:pos] = bytes(pos - start)  # Wipe the previously handed-out region
+        if n > self.block_size:
+            self._handed_out = pos
+            return memoryview(os.urandom(n))
+
+        remaining = self.block_size - pos
+        if remaining < n or remaining < self.low_water:
+            self._buffer[:] = os.urandom(self.block_size)
+            pos = 0
+
+        self._handed_out = pos
+        self._pos = pos + n
+        return self._view[pos:pos + n]
+
+    def wipe(self):
+        self._buffer[:] = bytes(self.block_size)
+        self._pos = self.block_size
+        self._handed_out = self.block_size
+
+
+class RandomBytePool:
+    """Prefetches large os.urandom blocks and hands them out in small slices.
+
+    Amortises the per-call syscall cost of many tiny reads. `read` returns a
+    memoryview into the calling thread's buffer that stays valid only until
+    that thread's next `read`, at which point the region is zeroed.
+
+    Each thread gets its own buffer, so reads never contend on a lock. After
+    `os.fork()` the child wipes and discards every inherited buffer, so forked
+    workers never replay the parent's randomness.
+    """
+
+    def __init__(self, block_size: int = 64 * 1024, low_water: int | None = None):
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        self.block_size = block_size
+        self.low_water = block_size // 16 if low_water is None else low_water
+        self._local = threading.local()
+        self._buffers = weakref.WeakSet()
+        self._lock = threading.Lock()  # Guards `_buffers` only; never taken on the read path
+        _FORK_SENSITIVE.add(self)
+
+    def read(self, n: int) -> memoryview:
+        """Returns `n` random bytes as a view into the pool (copied only if n > block_size)."""
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = _PoolBuffer(self.block_size, self.low_water)
+            with self._lock:
+                self._buffers.add(buffer)
+        return buffer.read(n)
+
+    def _after_fork(self):
+        # Only the forking thread survives in the child; wipe every inherited
+        # buffer, including other threads', before dropping them.
+        for buffer in list(self._buffers):
+            buffer.wipe()
+        self._local = threading.local()
+        self._buffers = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+
+class ShakeDRBG:
+    """Deterministic random bit generator that expands an os.urandom seed with SHAKE256.
+
+    Output is produced in large blocks (1 MiB by default) from
+    `shake_256(0x01 || key || counter)`; each block ratchets the key to
+    `shake_256(0x00 || key || counter)` and returned bytes are zeroed in the
+    buffered block, so a captured state cannot reproduce earlier output. After
+    `reseed_interval` output bytes fresh os.urandom entropy is mixed into the
+    key. Only the key ratchet and block bookkeeping hold the lock; the XOF
+    expansion itself runs outside it, so threads sharing one instance do not
+    queue behind each other's 1 MiB expansions. A forked child reseeds before
+    its first read. Pass an instance as `source` to opt in; it is never the default.
+    """
+
+    SEED_SIZE = 64
+
+    def __init__(self, block_size: int = 1 << 20, reseed_interval: int = 1 << 30):
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        self.block_size = block_size
+        self.reseed_interval = reseed_interval
+        self._lock = threading.Lock()
+        self._key = os.urandom(self.SEED_SIZE)
+        self._counter = 0
+        self._generated = 0   # Bytes produced since the last reseed
+        self._block = bytearray()
+        self._pos = 0
+        _FORK_SENSITIVE.add(self)
+
+    def reseed(self, additional_input: bytes = b""):
+        """Mixes fresh os.urandom entropy (and optional caller input) into the key."""
+        with self._lock:
+            self._reseed(additional_input)
+
+    def read(self, n: int) -> bytes:
+        with self._lock:
+            if self._generated >= self.reseed_interval:
+                self._reseed()
+            if len(self._block) - self._pos >= n:
+                start = self._pos
+                self._pos += n
+                out = bytes(self._block[start:self._pos])
+                self._block[start:self._pos] = bytes(n)
+                return out
+            # Large requests get one dedicated XOF call instead of many blocks
+            size = max(n, self.block_size)
+            seed = self._next_seed()
+            self._generated += size
+        output = hashlib.shake_256(seed).digest(size)
+        if size == n:
+            return output
+        block = bytearray(output)
+        out = bytes(block[:n])
+        block[:n] = bytes(n)
+        with self._lock:
+            # Replaces whatever another thread installed meanwhile; those bytes were never returned
+            self._block, self._pos = block, n
+        return out
+
+    def _next_seed(self) -> bytes:
+        """Ratchets the key and returns the input for the next output block; call with the lock held."""
+        state = self._key + self._counter.to_bytes(16, "big")
+        self._counter += 1
+        self._key = hashlib.shake_256(b"\x00" + state).digest(self.SEED_SIZE)
+        return b"\x01" + state
+
+    def _reseed(self, additional_input: bytes = b""):
+        self._key = hashlib.shake_256(self._key + os.urandom(self.SEED_SIZE) + additional_input).digest(self.SEED_SIZE)
+        self._counter = 0
+        self._generated = 0
+        self._block = bytearray()
+        self._pos = 0
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        self._reseed()
+
+
+class HashDRBG:
+    """NIST SP 800-90A Hash_DRBG (SHA-256 or SHA-512) usable as a randomness source.
+
+    Entropy and nonce come from os.urandom unless given explicitly, which is
+    only meant for known-answer testing. `reseed_counter` follows the standard;
+    `reseed_count` and `bytes_generated` are kept for accounting. With
+    `prediction_resistance` every request reseeds first. `read` splits large
+    requests into standard-sized generate calls, and a forked child reseeds
+    before its first read. Reads are serialised by a lock.
+    """
+
+    # hash name -> (seedlen bytes, security strength bytes)
+    PARAMETERS = {
+        "sha256": (55, 32),
+        "sha512": (111, 32),
+    }
+    MAX_BYTES_PER_REQUEST = 1 << 16   # 2**19 bits
+    MAX_RESEED_INTERVAL = 1 << 48
+
+    # CAVP Hash_DRBG SHA-256 known answer (no prediction resistance, no additional input):
+    # instantiate, generate 1024 bits twice, compare the second output.
+    _KAT_ENTROPY = "a65ad0f345db4e0effe875c3a2e71f42c7129d620ff5c119a9ef55f05185e0fb"
+    _KAT_NONCE = "8581f9317517276e06e9607ddbcbcc2e"
+    _KAT_OUTPUT = (
+        "d3e160c35b99f340b2628264d1751060e0045da383ff57a57d73a673d2b8d80d"
+        "aaf6a6c35a91bb4579d73fd0c8fed111b0391306828adfed528f018121b3febd"
+        "c343e797b87dbb63db1333ded9d1ece177cfa6b71fe8ab1da46624ed6415e51c"
+        "cde2c7ca86e283990eeaeb91120415528b2295910281b02dd431f4c9f70427df"
+    )
+    _self_tested = False
+
+    def __init__(self, hash_name: str = "sha256", reseed_interval: int = 1 << 20,
+                 prediction_resistance: bool = False, personalization: bytes = b"",
+                 entropy_input: bytes | None = None, nonce: bytes | None = None):
+        if hash_name not in self.PARAMETERS:
+            raise ValueError(f"Unsupported hash: {hash_name!r}")
+        if not 1 <= reseed_interval <= self.MAX_RESEED_INTERVAL:
+            raise ValueError("reseed_interval must be between 1 and 2**48")
+        self.hash_name = hash_name
+        self.seedlen, self.security_strength = self.PARAMETERS[hash_name]
+        self.reseed_interval = reseed_interval
+        self.prediction_resistance = prediction_resistance
+        self.reseed_count = 0
+        self.bytes_generated = 0
+        self._lock = threading.Lock()
+
+        if entropy_input is None:
+            if not HashDRBG._self_tested:
+                HashDRBG.self_test()
+            entropy_input = os.urandom(self.security_strength)
+        if nonce is None:
+            nonce = os.urandom(self.security_strength // 2)
+        self._v = self._hash_df(entropy_input + nonce + personalization, self.seedlen)
+        self._c = self._hash_df(b"\x00" + self._v, self.seedlen)
+        self.reseed_counter = 1
+        _FORK_SENSITIVE.add(self)
+
+    @staticmethod
+    def self_test():
+        """Runs the known-answer health test; raises RuntimeError on mismatch.
+
+        Runs automatically before the first instance seeded from os.urandom.
+        """
+        drbg = HashDRBG("sha256", entropy_input=bytes.fromhex(HashDRBG._KAT_ENTROPY),
+                        nonce=bytes.fromhex(HashDRBG._KAT_NONCE))
+        drbg.generate(128)
+        if drbg.generate(128) != bytes.fromhex(HashDRBG._KAT_OUTPUT):
+            raise RuntimeError("Hash_DRBG known-answer test failed")
+        HashDRBG._self_tested = True
+
+    def reseed(self, additional_input: bytes = b"", entropy_input: bytes | None = None):
+        with self._lock:
+            self._reseed(additional_input, entropy_input)
+
+    def generate(self, n: int, additional_input: bytes = b"") -> bytes:
+        """Returns `n` bytes from a single Hash_DRBG generate call (at most 64 KiB)."""
+        if n > self.MAX_BYTES_PER_REQUEST:
+            raise ValueError(f"At most {self.MAX_BYTES_PER_REQUEST} bytes per generate call")
+        with self._lock:
+            return self._generate(n, additional_input)
+
+    def read(self, n: int) -> bytes:
+        with self._lock:
+            chunks = []
+            while n > 0:
+                size = min(n, self.MAX_BYTES_PER_REQUEST)
+                chunks.append(self._generate(size))
+                n -= size
+            return b"".join(chunks)
+
+    def _hash(self, data: bytes) -> bytes:
+        return hashlib.new(self.hash_name, data).digest()
+
+    def _hash_df(self, seed_material: bytes, nbytes: int) -> bytes:
+        """Hash derivation function (SP 800-90A, 10.3.1)."""
+        prefix = (nbytes * 8).to_bytes(4, "big")
+        output = b""
+        counter = 1
+        while len(output) < nbytes:
+            output += self._hash(bytes([counter]) + prefix + seed_material)
+            counter += 1
+        return output[:nbytes]
+
+    def _add(self, *values) -> bytes:
+        modulus = 1 << (self.seedlen * 8)
+        total = sum(v if isinstance(v, int) else int.from_bytes(v, "big") for v in values) % modulus
+        return total.to_bytes(self.seedlen, "big")
+
+    def _reseed(self, additional_input: bytes = b"", entropy_input: bytes | None = None):
+        if entropy_input is None:
+            entropy_input = os.urandom(self.security_strength)
+        self._v = self._hash_df(b"\x01" + self._v + entropy_input + additional_input, self.seedlen)
+        self._c = self._hash_df(b"\x00" + self._v, self.seedlen)
+        self.reseed_counter = 1
+        self.reseed_count += 1
+
+    def _generate(self, n: int, additional_input: bytes = b"") -> bytes:
+        if self.prediction_resistance or self.reseed_counter > self.reseed_interval:
+            self._reseed(additional_input)
+            additional_input = b""
+        if additional_input:
+            self._v = self._add(self._v, self._hash(b"\x02" + self._v + additional_input))
+
+        # Hashgen (10.1.1.4)
+        hash_func = getattr(hashlib, self.hash_name)
+        seedlen, mask = self.seedlen, (1 << (self.seedlen * 8)) - 1
+        data = int.from_bytes(self._v, "big")
+        output = bytearray()
+        while len(output) < n:
+            output += hash_func(data.to_bytes(seedlen, "big")).digest()
+            data = (data + 1) & mask
+        h = self._hash(b"\x03" + self._v)
+        self._v = self._add(self._v, h, self._c, self.reseed_counter)
+        self.reseed_counter += 1
+        self.bytes_generated += n
+        return bytes(output[:n])
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        self._reseed()
+
+
+def _read_random(source, n: int):
+    """Reads `n` random bytes from `source`, or straight from os.urandom when it is None."""
+    return os.urandom(n) if source is None else source.read(n)
+
+
+def _sample_bytes(charset: Charset, total: int, source=None) -> bytes:
+    """Draws `total` unbiased characters from `charset` using bulk random reads.
+
+    Bytes at or above the largest multiple of the alphabet size are rejected so
+    that `byte % size` stays uniform; rejection and mapping happen in a single
+    `bytes.translate` call.
+    """
+    threshold, table, rejected = charset.threshold, charset.table, charset.rejected
+
+    out = b""
+    while len(out) < total:
+        need = total - len(out)
+        # Expected number of raw bytes plus some slack, so one read is almost always enough
+        raw = _read_random(source, need * 256 // threshold + need // 8 + 16)
+        out += bytes(raw).translate(table, rejected)
+    return out[:total]
+
+
+def _sample_choice(charset: Charset, total: int, source=None) -> bytes:
+    """Draws `total` characters from `charset` with one `secrets.choice` call each."""
+    if source is not None:
+        raise ValueError("The 'choice' engine draws from secrets and cannot use a custom source")
+    alphabet = charset.alphabet
+    return "".join(secrets.choice(alphabet) for _ in range(total)).encode("ascii")
+
+
+def _sample_numpy(charset: Charset, total: int, source=None) -> bytes:
+    """Vectorised variant of `_sample_bytes` for very large draws.
+
+    The raw buffer is filtered with a boolean mask and mapped with a single
+    gather through the translate table; the flat result is the row-major
+    N x L character matrix. Falls back to `_sample_bytes` without NumPy.
+    """
+    if np is None:
+        return _sample_bytes(charset, total, source)
+
+    threshold = charset.threshold
+    lookup = np.frombuffer(charset.table, dtype=np.uint8)
+
+    out = np.empty(max(total, 0), dtype=np.uint8)  # Negative lengths yield "", like the other engines
+    filled = 0
+    while filled < total:
+        need = total - filled
+        raw = np.frombuffer(_read_random(source, need * 256 // threshold + need // 8 + 16), dtype=np.uint8)
+        accepted = raw[raw < threshold][:need]
+        out[filled:filled + len(accepted)] = lookup[accepted]
+        filled += len(accepted)
+    return out.tobytes()
+
+
+def _randbits(source, k: int) -> int:
+    """Returns a uniform k-bit integer from `source` (secrets.randbits when it is None)."""
+    if source is None:
+        return secrets.randbits(k)
+    nbytes = (k + 7) // 8
+    return int.from_bytes(_read_random(source, nbytes), "big") >> (nbytes * 8 - k)
+
+
+# Characters produced per big-integer draw by `_sample_bigint`; covers the slider's maximum length
+_RADIX_BLOCK = 64
+
+
+def _sample_bigint(charset: Charset, total: int, source=None) -> bytes:
+    """Draws whole blocks of characters as one big integer in base `charset.size`.
+
+    Each block of up to `_RADIX_BLOCK` characters costs a single draw of
+    just enough bits to cover `size ** block` (rejecting out-of-range values
+    keeps it uniform) and one divmod chain, consuming the theoretical minimum
+    of entropy per password.
+    """
+    size = charset.size
+    out = bytearray()
+    for start in range(0, total, _RADIX_BLOCK):
+        block = min(_RADIX_BLOCK, total - start)
+        bound = size ** block
+        bits = (bound - 1).bit_length()
+        value = _randbits(source, bits)
+        while value >= bound:
+            value = _randbits(source, bits)
+
+        digits = bytearray(block)
+        for i in range(block):
+            value, digits[i] = divmod(value, size)
+        out += digits.translate(charset.table)
+    return bytes(out)
+
+
+class BitStreamSampler:
+    """Samples characters from a random bit stream while wasting as little entropy as possible.
+
+    Rather than spending a whole byte per attempt, the sampler keeps a value
+    `v` known to be uniform in `[0, c)` and tops it up with only as many fresh
+    bits as needed. When `v` falls in the biased tail it is not thrown away:
+    the remainder is still uniform over the smaller range and is recycled into
+    the next attempt, as is the quotient left over after a character is taken.
+    Consumption therefore approaches log2(size) bits per character.
+
+    `bytes_consumed` counts bytes read from `source`; `bits_consumed` is the
+    exact entropy spent so far. A sampler is not thread-safe.
+    """
+
+    # Keep `c` at least this many bits above the alphabet size, so attempts are almost never rejected
+    MARGIN_BITS = 16
+
+    def __init__(self, source=None, chunk_size: int = 32):
+        self.source = source
+        self.chunk_size = chunk_size
+        self.bytes_consumed = 0
+        self._pool = 0     # Unread random bits
+        self._pooled = 0   # Number of unread bits in `_pool`
+        self._size = 0     # Alphabet size the recycled state below belongs to
+        self._value = 0
+        self._range = 1
+        _FORK_SENSITIVE.add(self)
+
+    @property
+    def bits_consumed(self) -> int:
+        return self.bytes_consumed * 8 - self._pooled
+
+    def _bits(self, k: int) -> int:
+        while self._pooled < k:
+            raw = _read_random(self.source, self.chunk_size)
+            self.bytes_consumed += len(raw)
+            self._pool = (self._pool << (8 * len(raw))) | int.from_bytes(raw, "big")
+            self._pooled += 8 * len(raw)
+        self._pooled -= k
+        value = self._pool >> self._pooled
+        self._pool &= (1 << self._pooled) - 1
+        return value
+
+    def sample(self, charset: Charset, total: int) -> bytes:
+        """Returns `total` uniform characters from `charset`."""
+        size = charset.size
+        if size != self._size:
+            # Recycled state is only meaningful for the alphabet size it was built for
+            self._size, self._value, self._range = size, 0, 1
+        value, range_ = self._value, self._range
+        low = size << self.MARGIN_BITS
+
+        digits = bytearray(max(total, 0))  # Negative lengths yield "", like the other engines
+        for i in range(total):
+            while True:
+                if range_ < low:
+                    shift = (low // range_).bit_length()
+                    value = (value << shift) | self._bits(shift)
+                    range_ <<= shift
+                blocks = range_ // size
+                accepted = blocks * size
+                if value < accepted:
+                    value, digits[i] = divmod(value, size)
+                    range_ = blocks
+                    break
+                value -= accepted
+                range_ -= accepted
+
+        self._value, self._range = value, range_
+        return bytes(digits).translate(charset.table)
+
+    def _after_fork(self):
+        self._pool = self._pooled = 0
+        self._size, self._value, self._range = 0, 0, 1
+
+
+def _sample_bits(charset: Charset, total: int, source=None) -> bytes:
+    """Draws `total` characters through a fresh `BitStreamSampler`."""
+    return BitStreamSampler(source).sample(charset, total)
+
+
+_SAMPLERS = {
+    "choice": _sample_choice,
+    "bytes": _sample_bytes,
+    "numpy": _sample_numpy,
+    "bigint": _sample_bigint,
+    "bits": _sample_bits,
+}
+
+# Upper bound on characters drawn per chunk by the batch APIs, to keep peak memory flat
+_CHUNK_CHARS = 1 << 20
+# Streams use smaller chunks so the first password arrives quickly
+_STREAM_CHUNK_CHARS = 1 << 16
+
+
+def _get_sampler(engine: str):
+    try:
+        return _SAMPLERS[engine]
+    except KeyError:
+        raise ValueError(f"Unknown engine: {engine!r}") from None
+
+
+def _randbelow(source, n: int) -> int:
+    """Returns a uniform integer in [0, n) from `source` (secrets.randbelow when it is None)."""
+    if source is None:
+        return secrets.randbelow(n)
+    bits = n.bit_length()
+    value = _randbits(source, bits)
+    while value >= n:
+        value = _randbits(source, bits)
+    return value
+
+
+class _CompositionPlan:
+    """Exact sampler for how many characters of each class a password contains.
+
+    For class sizes `s_i` and allowed count ranges `[lo_i, hi_i]`, a count
+    vector `k` is compatible with `L! / prod(k_i!) * prod(s_i ** k_i)`
+    passwords. `total` sums that over every vector; `sample_counts` picks a
+    vector with exactly that weight, so shuffling the class labels and
+    filling each class uniformly yields a password uniform over all
+    compliant ones, with no retries.
+    """
+
+    def __init__(self, sizes: tuple[int, ...], bounds: tuple[tuple[int, int], ...], length: int):
+        classes = len(sizes)
+        # ways[i][r]: completions of the last r positions using classes i.. only
+        ways = [[0] * (length + 1) for _ in range(classes + 1)]
+        ways[classes][0] = 1
+        # choices[i][r]: (k, weight) options for class i with r positions left
+        self._choices = [[()] * (length + 1) for _ in range(classes)]
+        for i in range(classes - 1, -1, -1):
+            low, high = bounds[i]
+            for r in range(length + 1):
+                options = tuple(
+                    (k, math.comb(r, k) * sizes[i] ** k * ways[i + 1][r - k])
+                    for k in range(low, min(high, r) + 1)
+                    if ways[i + 1][r - k]
+                )
+                self._choices[i][r] = options
+                ways[i][r] = sum(weight for _, weight in options)
+        self._ways = ways
+        self.length = length
+        self.total = ways[0][length]
+
+    def sample_counts(self, source) -> list[int]:
+        """Draws one count vector from a single random integer below `total`."""
+        counts = []
+        remaining = self.length
+        x = _randbelow(source, self.total)
+        for i, choices in enumerate(self._choices):
+            for k, weight in choices[remaining]:
+                if x < weight:
+                    break
+                x -= weight
+            # x is uniform below weight = arrangements * ways[i + 1][remaining - k]; the
+            # quotient is a uniform draw for the remaining classes
+            x //= weight // self._ways[i + 1][remaining - k]
+            counts.append(k)
+            remaining -= k
+        return counts
+
+
+@lru_cache(maxsize=64)
+def _composition_plan(sizes: tuple[int, ...], bounds: tuple[tuple[int, int], ...], length: int) -> _CompositionPlan:
+    plan = _CompositionPlan(sizes, bounds, length)
+    if not plan.total:
+        raise ValueError("No password of this length satisfies the class requirements")
+    return plan
+
+
+def _sample_composition(policy: PasswordPolicy, bounds: tuple[tuple[int, int], ...], count: int,
+                        source=None) -> bytes:
+    """Samples passwords uniformly among those whose per-class counts lie within `bounds`.
+
+    Class counts come from `_CompositionPlan`, positions from a Fisher-Yates
+    shuffle of the class labels driven by one random integer below `length!`,
+    and the characters of each class from one bulk sampler call per class for
+    the whole batch.
+    """
+    classes = policy.classes
+    length = policy.length
+    plan = _composition_plan(tuple(charset.size for _, charset in classes), bounds, length)
+    permutations = math.factorial(length)
+
+    layouts = []
+    totals = [0] * len(classes)
+    for _ in range(count):
+        labels = bytearray()
+        for i, k in enumerate(plan.sample_counts(source)):
+            labels += bytes([i]) * k
+            totals[i] += k
+        x = _randbelow(source, permutations)
+        for j in range(length - 1, 0, -1):
+            x, swap = divmod(x, j + 1)
+            labels[j], labels[swap] = labels[swap], labels[j]
+        layouts.append(labels)
+
+    sample = _get_sampler(policy.engine)
+    pools = [iter(sample(charset, total, source)) for (_, charset), total in zip(classes, totals)]
+    out = bytearray(count * length)
+    pos = 0
+    for labels in layouts:
+        for label in labels:
+            out[pos] = next(pools[label])
+            pos += 1
+    return bytes(out)
+
+
+class _RunPlan:
+    """Exact sampler for passwords avoiding long repeats and ascending sequences.
+
+    The constraint automaton's state is the last character `c`, how many
+    times it has just repeated (`r`) and the length of the ascending run it
+    ends (`q`); at most one of `r`, `q` exceeds 1. `g[n][c]` counts valid
+    continuations of `n` characters after a fresh `c` (r = q = 1), and only
+    the two "special" successors of a state - repeating `c` or stepping to
+    its successor `succ[c]` - differ from that baseline, so every count is
+    `S - g[c] - g[succ c]` plus two corrections. Sampling picks among the
+    ordinary characters with a bisect over prefix sums of `g`, skipping the
+    two excluded ones.
+    """
+
+    def __init__(self, succ: tuple[int, ...], max_repeat: int | None, max_sequence: int | None, length: int):
+        self.succ = succ
+        self.max_repeat = max_repeat
+        self.max_sequence = max_sequence
+        self.length = length
+        size = len(succ)
+        # rep[n][r - 1][c]: continuations after c repeated r times; seq[n][q - 1][c]: after an ascending run of q
+        rows_r = max_repeat or 1
+        rows_q = max_sequence or 1
+        ones = [1] * size
+        self.rep = [[ones] * rows_r]
+        self.seq = [[ones] * rows_q]
+        self.prefix = [self._prefix(ones)]
+        for n in range(1, length):
+            g = self._row(n, 1, 1)
+            self.rep.append([g] + [self._row(n, r, 1) for r in range(2, rows_r + 1)])
+            self.seq.append([g] + [self._row(n, 1, q) for q in range(2, rows_q + 1)])
+            self.prefix.append(self._prefix(g))
+        self.total = self.prefix[length - 1][-1] if length else 1
+
+    @staticmethod
+    def _prefix(weights: list[int]) -> list[int]:
+        prefix = [0]
+        for weight in weights:
+            prefix.append(prefix[-1] + weight)
+        return prefix
+
+    def _count(self, n: int, c: int, r: int, q: int) -> int:
+        """Valid continuations of `n` characters from state (c, r, q)."""
+        if q > 1:
+            return self.seq[n][min(q, len(self.seq[n])) - 1][c]
+        return self.rep[n][min(r, len(self.rep[n])) - 1][c]
+
+    def _special(self, n: int, c: int, r: int, q: int) -> tuple[int, int]:
+        """Weights of repeating `c` and of stepping to `succ[c]`, with `n` characters left after it."""
+        repeat = self._count(n, c, r + 1, 1) if self.max_repeat is None or r < self.max_repeat else 0
+        s = self.succ[c]
+        step = 0
+        if s >= 0 and (self.max_sequence is None or q < self.max_sequence):
+            step = self._count(n, s, 1, q + 1)
+        return repeat, step
+
+    def _row(self, n: int, r: int, q: int) -> list[int]:
+        g = self.rep[n - 1][0]
+        total = self.prefix[n - 1][-1]
+        row = []
+        for c, s in enumerate(self.succ):
+            repeat, step = self._special(n - 1, c, r, q)
+            row.append(total - g[c] - (g[s] if s >= 0 else 0) + repeat + step)
+        return row
+
+    def sample(self, source) -> list[int]:
+        """Returns one valid password as alphabet indices, from a single random integer below `total`."""
+        length = self.length
+        if not length:
+            return []
+        succ, max_repeat, max_sequence = self.succ, self.max_repeat, self.max_sequence
+        x = _randbelow(source, self.total)
+        prefix = self.prefix[length - 1]
+        c = bisect_right(prefix, x) - 1
+        x -= prefix[c]
+        r = q = 1
+        out = [c]
+        for n in range(length - 2, -1, -1):
+            rep, g, prefix = self.rep[n], self.rep[n][0], self.prefix[n]
+            s = succ[c]
+            # Same weights as `_special`, inlined for the hot loop
+            if max_repeat is None:
+                repeat = g[c]
+            else:
+                repeat = rep[r][c] if r < max_repeat else 0
+            if s < 0:
+                step = 0
+            elif max_sequence is None:
+                step = g[s]
+            else:
+                step = self.seq[n][q][s] if q < max_sequence else 0
+            if x < repeat:
+                r, q = r + 1, 1
+            elif x < repeat + step:
+                x -= repeat
+                c, r, q = s, 1, q + 1
+            else:
+                # Map x from the ordinary characters onto the full prefix-sum axis by skipping c and succ[c]
+                x -= repeat + step
+                if x >= prefix[c]:
+                    x += g[c]
+                    if s >= 0 and x >= prefix[s]:
+                        x += g[s]
+                c = bisect_right(prefix, x) - 1
+                x -= prefix[c]
+                r = q = 1
+            out.append(c)
+        return out
+
+
+@lru_cache(maxsize=64)
+def _run_plan(charset: Charset, max_repeat: int | None, max_sequence: int | None, length: int) -> _RunPlan:
+    # Successor: the next ASCII character when it belongs to the same class (abc, 123, ABC, !"#), else -1;
+    # symbols like "/:" or "@[" are neighbours in string.punctuation but not in ASCII
+    succ = []
+    for name, options in _CLASS_OPTIONS.items():
+        alphabet = Charset.from_options(*options).alphabet
+        if alphabet[0] in charset.alphabet:
+            base = len(succ)
+            succ.extend(base + i + 1 if i + 1 < len(alphabet) and ord(alphabet[i + 1]) == ord(char) + 1 else -1
+                        for i, char in enumerate(alphabet))
+    plan = _RunPlan(tuple(succ), max_repeat, max_sequence, length)
+    if not plan.total:
+        raise ValueError("No password of this length satisfies the repeat and sequence limits")
+    return plan
+
+
+def _sample_runs(policy: PasswordPolicy, count: int, source=None) -> bytes:
+    """Samples passwords uniformly among those within the policy's repeat and sequence limits."""
+    charset = policy.charset
+    plan = _run_plan(charset, policy.max_repeat, policy.max_sequence, policy.length)
+    data = charset.data
+    out = bytearray()
+    for _ in range(count):
+        out += bytes(data[c] for c in plan.sample(source))
+    return bytes(out)
+
+
+def _sample_policy(policy: PasswordPolicy, count: int, source=None) -> bytes:
+    """Returns `count` passwords for `policy` as consecutive `policy.length`-byte ASCII runs.
+
+    Empty when the policy selects no characters. Every policy-driven API
+    (streams, batches, reservoirs, workers) draws through here.
+    """
+    charset = policy.charset
+    if not charset.size or policy.length <= 0:
+        return b""
+    if policy.max_repeat is not None or policy.max_sequence is not None:
+        return _sample_runs(policy, count, source)
+    bounds = policy.class_bounds
+    if bounds is not None:
+        return _sample_composition(policy, bounds, count, source)
+    return _get_sampler(policy.engine)(charset, count * policy.length, source)
+
+
+def _generate_chunks(policy: PasswordPolicy, count: int | None, source, chunk_chars: int) -> Iterator[list[str]]:
+    """Yields lists of passwords, each built from one sampler call of at most `chunk_chars` characters."""
+    length = policy.length
+    per_chunk = max(1, chunk_chars // length) if length > 0 else chunk_chars
+    remaining = count
+    while remaining is None or remaining > 0:
+        n = per_chunk if remaining is None else min(per_chunk, remaining)
+        text = _sample_policy(policy, n, source).decode("ascii")
+        if not text:
+            yield [""] * n
+        else:
+            yield [text[i:i + length] for i in range(0, n * length, length)]
+        if remaining is not None:
+            remaining -= n
+
+
+# Template code -> Charset.from_options flags; every other character is a literal
+_TEMPLATE_CODES = {
+    "A": _CLASS_OPTIONS["upper"],
+    "a": _CLASS_OPTIONS["lower"],
+    "9": _CLASS_OPTIONS["numbers"],
+    "s": _CLASS_OPTIONS["symbols"],
+    "*": (True, True, True, True),
+}
+
+
+@dataclass(frozen=True)
+class PasswordTemplate:
+    """A compiled password layout such as "Aaaa-9999-ssss" or "A{2}a{6}9{4}".
+
+    Codes: "A" upper, "a" lower, "9" digit, "s" symbol, "*" any of those.
+    Any other character is a literal, "\\" escapes the next character and
+    "{n}" repeats the preceding item n times. Use `PasswordTemplate.compile`
+    so each template string is parsed once.
+    """
+
+    # Bound on the expanded length, so "*{999999999}" fails fast instead of exhausting memory
+    MAX_LENGTH = 4096
+
+    pattern: str
+    length: int = field(init=False, compare=False)
+    literal: bytes = field(init=False, repr=False, compare=False)  # Fixed characters, 0 at class positions
+    groups: tuple[tuple[Charset, tuple[int, ...]], ...] = field(init=False, repr=False, compare=False)
+    digits: tuple[tuple[int, int, bytes], ...] = field(init=False, repr=False, compare=False)  # (pos, size, data)
+    space: int = field(init=False, repr=False, compare=False)  # Number of distinct passwords
+    bits: float = field(init=False, compare=False)
+
+    def __post_init__(self):
+        items = []  # Charset or literal byte per position
+        repeated = False  # Whether the last token was "{n}", which cannot itself be repeated
+        i, pattern = 0, self.pattern
+        while i < len(pattern):
+            char = pattern[i]
+            if char == "{":
+                end = pattern.find("}", i)
+                digits = pattern[i + 1:end] if end != -1 else ""
+                if not items or repeated or not digits.isdigit():
+                    raise ValueError(f"Invalid repeat at position {i} of {pattern!r}")
+                n = int(digits)
+                if len(items) - 1 + n > self.MAX_LENGTH:
+                    raise ValueError(f"Templates expand to at most {self.MAX_LENGTH} characters")
+                items[-1:] = items[-1:] * n
+                repeated = True
+                i = end + 1
+                continue
+            repeated = False
+            if char == "\\":
+                i += 1
+                if i == len(pattern):
+                    raise ValueError(f"Dangling escape at the end of {pattern!r}")
+                char = pattern[i]
+            elif char in _TEMPLATE_CODES:
+                items.append(Charset.from_options(*_TEMPLATE_CODES[char]))
+                i += 1
+                continue
+            if not (char.isascii() and char.isprintable()):
+                raise ValueError(f"Template literals must be printable ASCII, got {char!r}")
+            items.append(ord(char))
+            i += 1
+        if len(items) > self.MAX_LENGTH:
+            raise ValueError(f"Templates expand to at most {self.MAX_LENGTH} characters")
+
+        positions = {}
+        for pos, item in enumerate(items):
+            if isinstance(item, Charset):
+                positions.setdefault(item, []).append(pos)
+        object.__setattr__(self, "length", len(items))
+        object.__setattr__(self, "literal", bytes(0 if isinstance(item, Charset) else item for item in items))
+        object.__setattr__(self, "groups", tuple((charset, tuple(p)) for charset, p in positions.items()))
+        object.__setattr__(self, "digits", tuple((pos, item.size, item.data) for pos, item in enumerate(items)
+                                                 if isinstance(item, Charset)))
+        object.__setattr__(self, "space", math.prod(size for _, size, _ in self.digits))
+        object.__setattr__(self, "bits", math.log2(self.space))
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def compile(pattern: str) -> "PasswordTemplate":
+        """Returns the compiled template for `pattern`, parsing each string only once."""
+        return PasswordTemplate(pattern)
+
+    def sample(self, count: int, source=None) -> bytes:
+        """Returns `count` passwords as consecutive `length`-byte ASCII runs.
+
+        A single password is one random integer below `space` read off as
+        mixed-radix digits. Batches draw each class with one bulk
+        `_sample_bytes` call and scatter it into its positions with strided
+        slice assignment.
+        """
+        length = self.length
+        out = bytearray(self.literal * count)
+        if count == 1:
+            x = _randbelow(source, self.space)
+            for pos, size, data in self.digits:
+                x, digit = divmod(x, size)
+                out[pos] = data[digit]
+            return bytes(out)
+        for charset, positions in self.groups:
+            chars = _sample_bytes(charset, count * len(positions), source)
+            for j, pos in enumerate(positions):
+                out[pos::length] = chars[j::len(positions)]
+        return bytes(out)
+
+
+# Alphabet for regex-constrained generation: the 94 printable ASCII characters the checkboxes cover
+_REGEX_ALPHABET = Charset.from_options(True, True, True, True).alphabet
+_REGEX_ALL = (1 << len(_REGEX_ALPHABET)) - 1
+
+
+def _regex_mask(chars: str) -> int:
+    """Bitmask over `_REGEX_ALPHABET` for the characters in `chars`."""
+    mask = 0
+    for char in chars:
+        index = _REGEX_ALPHABET.find(char)
+        if index < 0:
+            raise ValueError(f"{char!r} is outside the printable characters passwords are drawn from")
+        mask |= 1 << index
+    return mask
+
+
+_REGEX_ESCAPES = {
+    "d": _regex_mask(string.digits),
+    "w": _regex_mask(string.ascii_letters + string.digits + "_"),
+}
+_REGEX_ESCAPES.update({code.upper(): _REGEX_ALL & ~mask for code, mask in list(_REGEX_ESCAPES.items())})
+
+
+class _RegexParser:
+    """Recursive-descent parser for the regex subset `PasswordRegex` accepts.
+
+    Produces a small AST of tuples: ("set", mask), ("cat", nodes),
+    ("alt", nodes) and ("repeat", node, min, max_or_None).
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.pos = 0
+
+    def parse(self):
+        node = self._alternation()
+        if self.pos != len(self.pattern):
+            self._fail("unexpected " + repr(self.pattern[self.pos]))
+        return node
+
+    def _fail(self, message: str):
+        raise ValueError(f"Unsupported regex {self.pattern!r} at position {self.pos}: {message}")
+
+    def _peek(self) -> str:
+        return self.pattern[self.pos] if self.pos < len(self.pattern) else ""
+
+    def _alternation(self):
+        branches = [self._concatenation()]
+        while self._peek() == "|":
+            self.pos += 1
+            branches.append(self._concatenation())
+        return branches[0] if len(branches) == 1 else ("alt", branches)
+
+    def _concatenation(self):
+        items = []
+        while self._peek() not in ("", "|", ")"):
+            items.append(self._quantified(self._atom()))
+        return ("cat", items)
+
+    def _atom(self):
+        char = self._peek()
+        self.pos += 1
+        if char == "(":
+            if self.pattern.startswith("?:", self.pos):
+                self.pos += 2
+            node = self._alternation()
+            if self._peek() != ")":
+                self._fail("missing )")
+            self.pos += 1
+            return node
+        if char == "[":
+            return ("set", self._class())
+        if char == ".":
+            return ("set", _REGEX_ALL)
+        if char == "\\":
+            return ("set", self._escape())
+        if char in "*+?{":
+            self._fail("nothing to repeat")
+        if char in "^$":
+            # The whole password must match anyway, so anchors are only accepted where they are no-ops
+            if (char == "^" and self.pos == 1) or (char == "$" and self.pos == len(self.pattern)):
+                return ("cat", [])
+            self._fail("anchors are only allowed at the ends")
+        return ("set", _regex_mask(char))
+
+    def _escape(self) -> int:
+        char = self._peek()
+        self.pos += 1
+        if not char:
+            self._fail("dangling escape")
+        if char in _REGEX_ESCAPES:
+            return _REGEX_ESCAPES[char]
+        if char.isalnum():
+            self._fail(f"unknown escape \\{char}")
+        return _regex_mask(char)
+
+    def _class(self) -> int:
+        negate = self._peek() == "^"
+        if negate:
+            self.pos += 1
+        mask = 0
+        first = True
+        while True:
+            char = self._peek()
+            if not char:
+                self._fail("missing ]")
+            self.pos += 1
+            if char == "]" and not first:
+                break
+            first = False
+            if char == "\\":
+                escaped = self._escape()
+                if escaped & (escaped - 1):  # \d, \w and friends cannot start a range
+                    mask |= escaped
+                    continue
+                char = _REGEX_ALPHABET[escaped.bit_length() - 1]
+            if self._peek() == "-" and self.pattern[self.pos + 1:self.pos + 2] not in ("]", ""):
+                self.pos += 1
+                end = self._peek()
+                self.pos += 1
+                if end == "\\":
+                    end = _REGEX_ALPHABET[self._escape().bit_length() - 1]
+                if ord(end) < ord(char):
+                    self._fail(f"bad range {char}-{end}")
+                mask |= _regex_mask("".join(map(chr, range(ord(char), ord(end) + 1))))
+            else:
+                mask |= _regex_mask(char)
+        return _REGEX_ALL & ~mask if negate else mask
+
+    def _quantified(self, node):
+        while True:
+            char = self._peek()
+            if char == "*":
+                low, high = 0, None
+            elif char == "+":
+                low, high = 1, None
+            elif char == "?":
+                low, high = 0, 1
+            elif char == "{":
+                end = self.pattern.find("}", self.pos)
+                body = self.pattern[self.pos + 1:end] if end != -1 else ""
+                low_text, comma, high_text = body.partition(",")
+                if not low_text.isdigit() or (high_text and not high_text.isdigit()):
+                    self._fail("bad repeat count")
+                low = int(low_text)
+                high = None if comma and not high_text else int(high_text or low_text)
+                if high is not None and high < low:
+                    self._fail("bad repeat range")
+                self.pos = end
+            else:
+                return node
+            self.pos += 1
+            node = ("repeat", node, low, high)
+
 
-        return "".join(secrets.choice(alphabet) for _ in range(length))
+class _NFA:
+    """Thompson NFA: `edges[s]` holds (mask, target) pairs, `eps[s]` epsilon targets."""
+
+    def __init__(self, tree, max_states: int):
+        self.edges = []
+        self.eps = []
+        self.max_states = max_states
+        self.start, self.accept = self._build(tree)
+
+    def _state(self) -> int:
+        if len(self.edges) >= self.max_states:
+            raise ValueError("Regex is too large to compile")
+        self.edges.append([])
+        self.eps.append([])
+        return len(self.edges) - 1
+
+    def _build(self, node) -> tuple[int, int]:
+        kind = node[0]
+        if kind == "set":
+            start, end = self._state(), self._state()
+            self.edges[start].append((node[1], end))
+            return start, end
+        if kind == "cat":
+            start = end = self._state()
+            for child in node[1]:
+                child_start, child_end = self._build(child)
+                self.eps[end].append(child_start)
+                end = child_end
+            return start, end
+        if kind == "alt":
+            start, end = self._state(), self._state()
+            for child in node[1]:
+                child_start, child_end = self._build(child)
+                self.eps[start].append(child_start)
+                self.eps[child_end].append(end)
+            return start, end
+        _, child, low, high = node
+        start = end = self._state()
+        for _ in range(low):
+            child_start, child_end = self._build(child)
+            self.eps[end].append(child_start)
+            end = child_end
+        if high is None:
+            child_start, child_end = self._build(child)
+            self.eps[end].append(child_start)
+            self.eps[child_end].append(end)
+            return start, end
+        exit_state = self._state()
+        for _ in range(high - low):
+            child_start, child_end = self._build(child)
+            self.eps[end].append(child_start)
+            self.eps[end].append(exit_state)
+            end = child_end
+        self.eps[end].append(exit_state)
+        return start, exit_state
+
+    def closure(self, states) -> frozenset:
+        seen = set(states)
+        stack = list(states)
+        while stack:
+            for target in self.eps[stack.pop()]:
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        return frozenset(seen)
+
+
+class PasswordRegex:
+    """A regular expression compiled to a DFA for uniform constrained generation.
+
+    Supports literals, escapes (\\d \\w \\D \\W and escaped punctuation),
+    classes with ranges and negation, ".", groups, "|" and the quantifiers
+    * + ? {m} {m,} {m,n}; the whole password must match. Strings are drawn
+    from the 94 printable ASCII characters. Path counts per DFA state and
+    remaining length make every matching password of a given length equally
+    likely, with no retries. Use `PasswordRegex.compile` to reuse the DFA.
+    """
+
+    # Bounds on automaton size, so hostile patterns fail fast instead of exhausting memory
+    MAX_NFA_STATES = 20_000
+    MAX_DFA_STATES = 4096
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        nfa = _NFA(_RegexParser(pattern).parse(), self.MAX_NFA_STATES)
+        start = nfa.closure([nfa.start])
+        index = {start: 0}
+        order = [start]
+        # transitions[s]: (target, characters) pairs, one per distinct target state
+        self.transitions = []
+        self.accepting = []
+        for states in order:
+            by_targets = {}
+            edges = [edge for state in states for edge in nfa.edges[state]]
+            for c, char in enumerate(_REGEX_ALPHABET):
+                targets = frozenset(target for mask, target in edges if mask >> c & 1)
+                if targets:
+                    by_targets.setdefault(targets, []).append(char)
+            by_dfa = {}
+            for targets, chars in by_targets.items():
+                closed = nfa.closure(targets)
+                if closed not in index:
+                    if len(order) >= self.MAX_DFA_STATES:
+                        raise ValueError("Regex is too large to compile")
+                    index[closed] = len(order)
+                    order.append(closed)
+                by_dfa.setdefault(index[closed], []).extend(chars)
+            self.transitions.append(tuple((target, "".join(chars).encode("ascii"))
+                                          for target, chars in by_dfa.items()))
+            self.accepting.append(nfa.accept in states)
+        self._counts = {}
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def compile(pattern: str) -> "PasswordRegex":
+        """Returns the compiled DFA for `pattern`, building each only once."""
+        return PasswordRegex(pattern)
+
+    def path_counts(self, length: int) -> list[list[int]]:
+        """`counts[r][s]`: strings of length r that lead from state s to acceptance (cached per length)."""
+        counts = self._counts.get(length)
+        if counts is None:
+            counts = [[int(accepting) for accepting in self.accepting]]
+            for _ in range(length):
+                previous = counts[-1]
+                counts.append([sum(len(chars) * previous[target] for target, chars in transitions)
+                               for transitions in self.transitions])
+            self._counts[length] = counts
+        return counts
+
+    def count(self, length: int) -> int:
+        """Number of distinct passwords of `length` characters matching the pattern."""
+        return self.path_counts(length)[length][0]
+
+    def sample(self, length: int, count: int = 1, source=None) -> bytes:
+        """Returns `count` matching passwords as consecutive `length`-byte ASCII runs.
+
+        Each password is one random integer below `count(length)` walked down
+        the DFA: at every step the quotient by the chosen character's
+        successors is a uniform draw for the rest of the string.
+        """
+        counts = self.path_counts(length)
+        total = counts[length][0]
+        if not total:
+            raise ValueError(f"No password of length {length} matches {self.pattern!r}")
+        transitions = self.transitions
+        out = bytearray(count * length)
+        pos = 0
+        for _ in range(count):
+            x = _randbelow(source, total)
+            state = 0
+            for remaining in range(length - 1, -1, -1):
+                below = counts[remaining]
+                for target, chars in transitions[state]:
+                    weight = len(chars) * below[target]
+                    if x < weight:
+                        break
+                    x -= weight
+                x, digit = divmod(x, len(chars))
+                out[pos] = chars[digit]
+                pos += 1
+                state = target
+        return bytes(out)
+
+
+def _fixed_offsets(count: int, length: int) -> array:
+    return array("I", range(0, count * length + 1, length)) if length else array("I", bytes(4 * (count + 1)))
+
+
+class PasswordBatch:
+    """Many passwords packed into one contiguous buffer plus an `array('I')` of offsets.
+
+    Password `i` spans `data[offsets[i]:offsets[i + 1]]` and is only decoded
+    to `str` when accessed, which avoids the per-object overhead of a large
+    `list[str]`. Slices share the buffer and offsets instead of copying.
+    `wipe()` zeroes the batch's region of the buffer; leaving a `with` block
+    does the same.
+    """
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, data, offsets: array):
+        self._data = memoryview(data).cast("B")
+        self._offsets = memoryview(offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("PasswordBatch slices must be contiguous")
+            return PasswordBatch(self._share(), self._offsets[start:max(start, stop) + 1])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("batch index out of range")
+        return str(self._data[self._offsets[index]:self._offsets[index + 1]], "ascii")
+
+    def __iter__(self) -> Iterator[str]:
+        data, offsets = self._data, self._offsets
+        for i in range(len(offsets) - 1):
+            yield str(data[offsets[i]:offsets[i + 1]], "ascii")
+
+    @property
+    def nbytes(self) -> int:
+        return self._offsets[-1] - self._offsets[0]
+
+    @property
+    def view(self) -> memoryview:
+        """The batch's raw ASCII bytes, without copying."""
+        return self._share()[self._offsets[0]:self._offsets[-1]]
+
+    def _share(self) -> memoryview:
+        """The buffer that slices and `view` are cut from."""
+        return self._data
+
+    def tobytes(self) -> bytes:
+        return self.view.tobytes()
+
+    def writeto(self, file, sep: bytes = b"\n", items_per_write: int = 4096) -> int:
+        """Writes every password followed by `sep` to a binary file; returns the bytes written."""
+        if not sep:
+            return file.write(self.view)
+        data, offsets = self._data, self._offsets
+        written = 0
+        for first in range(0, len(self), items_per_write):
+            last = min(first + items_per_write, len(self))
+            block = sep.join([data[offsets[i]:offsets[i + 1]] for i in range(first, last)]) + sep
+            written += file.write(block)
+        return written
+
+    def wipe(self):
+        start, stop = self._offsets[0], self._offsets[-1]
+        self._data[start:stop] = bytes(stop - start)
+
+    def close(self):
+        self.wipe()
+
+    def __enter__(self) -> "PasswordBatch":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class PasswordGenerator:
+    """Handles the logic of password generation and strength estimation."""
+
+    ENGINES = tuple(_SAMPLERS)
+
+    @staticmethod
+    def generate(length: int, use_upper: bool, use_lower: bool, use_numbers: bool, use_symbols: bool,
+                 engine: str = "choice", source=None) -> str:
+        """Generates a cryptographically secure random password.
+
+        `engine` selects how randomness is drawn: "choice" calls `secrets.choice`
+        per character, "bytes" rejection-samples one bulk `os.urandom` read and
+        "numpy" does the same with vectorised masks (when NumPy is installed)
+        and "bigint" converts one big random integer into base-N digits;
+        "bits" samples from a bit stream and recycles rejected entropy.
+        Every engine except "choice" reads from `source` (e.g. a `RandomBytePool`) if given.
+        """
+        sample = _get_sampler(engine)
+        charset = Charset.from_options(use_upper, use_lower, use_numbers, use_symbols)
+        if not charset.size:
+            return ""
+
+        return sample(charset, length, source).decode("ascii")
+
+    @staticmethod
+    def generate_many(count: int, length: int, use_upper: bool = True, use_lower: bool = True,
+                      use_numbers: bool = True, use_symbols: bool = True, engine: str = "bytes",
+                      source=None) -> list[str]:
+        """Generates `count` passwords sharing one alphabet, drawing randomness in large chunks.
+
+        Optimised for throughput: the charset is looked up once and each chunk of up
+        to `_CHUNK_CHARS` characters is produced by a single sampler call, then
+        sliced into passwords. `generate_batch` avoids the per-`str` overhead.
+        """
+        policy = PasswordPolicy(length, use_upper, use_lower, use_numbers, use_symbols, engine)
+        passwords = []
+        for chunk in _generate_chunks(policy, count, source, _CHUNK_CHARS):
+            passwords.extend(chunk)
+        return passwords
+
+    @staticmethod
+    def generate_batch(count: int, policy: PasswordPolicy = PasswordPolicy(), source=None) -> PasswordBatch:
+        """Like `generate_many`, but returns a compact `PasswordBatch` instead of a list of `str`.
+
+        Chunks are sampled straight into the batch's single bytearray.
+        """
+        length = policy.length if policy.charset.size else 0
+        data = bytearray(count * length)
+        if length:
+            view = memoryview(data)
+            per_chunk = max(1, _CHUNK_CHARS // length)
+            for start in range(0, count, per_chunk):
+                n = min(per_chunk, count - start)
+                PasswordGenerator.generate_into(view[start * length:], policy, n, source)
+        return PasswordBatch(data, _fixed_offsets(count, length))
+
+    @staticmethod
+    def generate_stream(policy: PasswordPolicy, count: int | None = None, source=None) -> Iterator[str]:
+        """Lazily yields `count` passwords (forever if None) for `policy`.
+
+        Passwords are produced one chunk of up to `_STREAM_CHUNK_CHARS`
+        characters at a time, and the next chunk is only drawn once the
+        consumer has pulled the previous one, so memory stays flat regardless
+        of `count` and a slow consumer naturally applies backpressure.
+        """
+        for chunk in _generate_chunks(policy, count, source, _STREAM_CHUNK_CHARS):
+            yield from chunk
+
+    @staticmethod
+    def generate_into(buf, policy: PasswordPolicy = PasswordPolicy(), count: int = 1, source=None) -> int:
+        """Writes `count` passwords for `policy` as ASCII bytes into the caller-owned `buf`.
+
+        `buf` may be a bytearray, memoryview or any writable buffer; passwords
+        are laid out back to back from offset 0 and no `str` is created, so
+        the long-lived copy is memory the caller can wipe. The samplers still
+        build short-lived immutable `bytes` (the raw random input and the mapped
+        characters) that are freed without being zeroed. Returns the number of
+        bytes written.
+        """
+        view = memoryview(buf).cast("B")
+        if view.readonly:
+            raise TypeError("generate_into needs a writable buffer")
+        total = count * policy.length if policy.charset.size else 0
+        if total > len(view):
+            raise ValueError(f"Buffer holds {len(view)} bytes, {total} needed")
+        data = _sample_policy(policy, count, source)
+        view[:len(data)] = data
+        return len(data)
+
+    @staticmethod
+    def generate_from_template(template: str, source=None) -> str:
+        """Generates one password following `template` (see `PasswordTemplate`), e.g. "Aaaa-9999-ssss"."""
+        return PasswordTemplate.compile(template).sample(1, source).decode("ascii")
+
+    @staticmethod
+    def generate_many_from_template(count: int, template: str, source=None) -> list[str]:
+        """Generates `count` passwords following `template`, in chunks of up to `_CHUNK_CHARS` characters."""
+        compiled = PasswordTemplate.compile(template)
+        length = compiled.length
+        if not length:
+            return [""] * count
+        per_chunk = max(1, _CHUNK_CHARS // length)
+        passwords = []
+        for start in range(0, count, per_chunk):
+            n = min(per_chunk, count - start)
+            text = compiled.sample(n, source).decode("ascii")
+            passwords.extend(text[i:i + length] for i in range(0, n * length, length))
+        return passwords
+
+    @staticmethod
+    def generate_matching(pattern: str, length: int, source=None) -> str:
+        """Generates one password of `length` characters fully matching `pattern` (see `PasswordRegex`)."""
+        return PasswordRegex.compile(pattern).sample(length, 1, source).decode("ascii")
+
+    @staticmethod
+    def generate_many_matching(count: int, pattern: str, length: int, source=None) -> list[str]:
+        """Generates `count` passwords of `length` characters, uniform over the strings matching `pattern`."""
+        text = PasswordRegex.compile(pattern).sample(length, count, source).decode("ascii")
+        if not length:
+            return [""] * count
+        return [text[i:i + length] for i in range(0, count * length, length)]
 
     @staticmethod
     def calculate_strength(password: str) -> tuple[int, str]:
@@ -40,16 +1575,17 @@ class PasswordGenerator:
         if not password:
             return 0, "Too Short"
 
-        pool_size = 0
-        if any(c.isupper() for c in password): pool_size += 26
-        if any(c.islower() for c in password): pool_size += 26
-        if any(c.isdigit() for c in password): pool_size += 10
-        if any(c in string.punctuation for c in password): pool_size += 32
+        charset = Charset.from_options(
+            any(c.isupper() for c in password),
+            any(c.islower() for c in password),
+            any(c.isdigit() for c in password),
+            any(c in string.punctuation for c in password),
+        )
         
-        if pool_size == 0:
+        if charset.size == 0:
             return 0, "Weak"
 
-        entropy = len(password) * math.log2(pool_size)
+        entropy = len(password) * charset.bits_per_char
 
         if entropy < 28: return 0, "Weak"
         elif entropy < 36: return 1, "Fair"
@@ -59,303 +1595,641 @@ class PasswordGenerator:
 
 
 # -----------------------------------------------------------------------------
-# User Interface (View & Controller)
+# Prefilled Reservoir
 # -----------------------------------------------------------------------------
 
-class PasswordGeneratorApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Secure Password Generator")
-        self.setFixedSize(450, 600)
-        
-        # Determine if we are in dark mode (heuristic) or just force a clean light theme
-        # For simplicity and reliability, we'll implement a clean custom stylesheet
-        self._apply_styles()
-
-        self.central_widget = QWidget()
-        self.setCentralWidget(self.central_widget)
-        self.layout = QVBoxLayout(self.central_widget)
-        self.layout.setSpacing(20)
-        self.layout.setContentsMargins(30, 30, 30, 30)
-
-        self._build_ui()
-        self.generate_password() # Initial generation
-
-    def _apply_styles(self):
-        # Dark Mode Theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2b2b;
-            }
-            QLabel {
-                font-family: 'Helvetica Neue', Helvetica, Arial, sans-serif;
-                color: #ffffff;
-            }
-            QLineEdit {
-                background-color: #3b3b3b;
-                border: 1px solid #555555;
-                border-radius: 8px;
-                padding: 10px;
-                font-family: 'Courier New';
-                font-size: 18px;
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #0a84ff;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #007aff;
-            }
-            QPushButton:pressed {
-                background-color: #0062cc;
-            }
-            QPushButton#copyButton {
-                background-color: #4a4a4a;
-                color: #64d2ff;
-            }
-            QPushButton#copyButton:hover {
-                background-color: #555555;
-            }
-            QGroupBox {
-                border: none;
-            }
-            QCheckBox {
-                color: #ffffff;
-                spacing: 8px;
-                font-size: 14px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 2px solid #888;
-                background: #3b3b3b;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #0a84ff;
-                border-color: #0a84ff;
-                image: url(data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHZpZXdCb3g9IjAgMCAyNCAyNCIgZmlsbD0ibm9uZSIgc3Ryb2tlPSJ3aGl0ZSIgc3Ryb2tlLXdpZHRoPSIzIiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiPjxwb2x5bGluZSBwb2ludHM9IjIwIDYgOSAxNyA0IDEyIi8+PC9zdmc+);
-            }
-            QProgressBar {
-                border: none;
-                background-color: #4a4a4a;
-                border-radius: 4px;
-                height: 8px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                border-radius: 4px;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #555555;
-                height: 4px;
-                background: #4a4a4a;
-                margin: 2px 0;
-                border-radius: 2px;
-            }
-            QSlider::handle:horizontal {
-                background: #d0d0d0;
-                border: 1px solid #555555;
-                width: 18px;
-                height: 18px;
-                margin: -8px 0;
-                border-radius: 9px;
-            }
-        """)
-
-    def _build_ui(self):
-        # Header
-        header_label = QLabel("Password Generator")
-        header_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #1d1d1f;")
-        self.layout.addWidget(header_label, alignment=Qt.AlignmentFlag.AlignCenter)
-        self.layout.addSpacing(10)
-
-        # Password Display
-        display_layout = QHBoxLayout()
-        self.password_display = QLineEdit()
-        self.password_display.setReadOnly(True)
-        self.password_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        display_layout.addWidget(self.password_display)
-
-        self.copy_btn = QPushButton("Copy")
-        self.copy_btn.setObjectName("copyButton")
-        self.copy_btn.setFixedWidth(80)
-        self.copy_btn.clicked.connect(self.copy_to_clipboard)
-        display_layout.addWidget(self.copy_btn)
-        
-        self.layout.addLayout(display_layout)
+class PasswordReservoir:
+    """Keeps up to `capacity` pre-generated passwords for one policy, for O(1) `pop`.
 
-        # Strength Meter
-        self.strength_bar = QProgressBar()
-        self.strength_bar.setTextVisible(False)
-        self.layout.addWidget(self.strength_bar)
+    A daemon thread tops the reservoir back up whenever it drops below
+    `low_water` and wipes entries older than `ttl` seconds. Entries are kept
+    as bytearrays so they can be zeroed on expiry, on `pop` and on `close`;
+    the immutable `bytes` each refill is sampled into are freed unwiped.
+    `max_bytes` caps the memory held by entries. When the reservoir is empty
+    `pop` falls back to generating inline and counts a miss. If the refill
+    thread fails, `pop` raises RuntimeError chained to the original error.
+    """
 
-        self.strength_label = QLabel("Strength: Weak")
-        self.strength_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.strength_label.setStyleSheet("font-size: 12px; font-weight: bold; color: #8e8e93;")
-        self.layout.addWidget(self.strength_label)
-        
-        self.layout.addSpacing(10)
+    def __init__(self, policy: PasswordPolicy = PasswordPolicy(), capacity: int = 1024,
+                 low_water: int | None = None, ttl: float | None = 300.0, max_bytes: int | None = None):
+        if policy.length <= 0 or not policy.charset.size:
+            raise ValueError("policy must produce non-empty passwords")
+        # Surfaces unsatisfiable class requirements or limits here rather than in the refill thread
+        probe = bytearray(_sample_policy(policy, 1))
+        probe[:] = bytes(len(probe))
+        if max_bytes is not None:
+            capacity = min(capacity, max_bytes // max(1, policy.length))
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.policy = policy
+        self.capacity = capacity
+        self.low_water = capacity // 4 if low_water is None else min(low_water, capacity)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self._entries: deque[tuple[float, bytearray]] = deque()   # (expiry, password), oldest first
+        self._condition = threading.Condition(threading.Lock())
+        self._closed = False
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._refill_loop, name="PasswordReservoir", daemon=True)
+        self._thread.start()
 
-        # Length Slider
-        length_layout = QHBoxLayout()
-        length_label = QLabel("Length:")
-        self.length_value_label = QLabel("16")
-        self.length_value_label.setStyleSheet("font-weight: bold;")
-        
-        length_layout.addWidget(length_label)
-        length_layout.addStretch()
-        length_layout.addWidget(self.length_value_label)
-        self.layout.addLayout(length_layout)
-
-        self.length_slider = QSlider(Qt.Orientation.Horizontal)
-        self.length_slider.setMinimum(6)
-        self.length_slider.setMaximum(64)
-        self.length_slider.setValue(16)
-        self.length_slider.valueChanged.connect(self.update_length_label)
-        self.length_slider.valueChanged.connect(self.generate_password)
-        self.layout.addWidget(self.length_slider)
-
-        self.layout.addSpacing(10)
-
-        # Options
-        options_layout = QVBoxLayout()
-        self.chk_upper = QCheckBox("Uppercase (A-Z)")
-        self.chk_upper.setChecked(True)
-        self.chk_upper.stateChanged.connect(self.generate_password)
-        
-        self.chk_lower = QCheckBox("Lowercase (a-z)")
-        self.chk_lower.setChecked(True)
-        self.chk_lower.stateChanged.connect(self.generate_password)
-        
-        self.chk_numbers = QCheckBox("Numbers (0-9)")
-        self.chk_numbers.setChecked(True)
-        self.chk_numbers.stateChanged.connect(self.generate_password)
-        
-        self.chk_symbols = QCheckBox("Symbols (!@#$)")
-        self.chk_symbols.setChecked(True)
-        self.chk_symbols.stateChanged.connect(self.generate_password)
-
-        # Grid-like arrangement for check boxes
-        row1 = QHBoxLayout()
-        row1.addWidget(self.chk_upper)
-        row1.addWidget(self.chk_lower)
-        options_layout.addLayout(row1)
-
-        row2 = QHBoxLayout()
-        row2.addWidget(self.chk_numbers)
-        row2.addWidget(self.chk_symbols)
-        options_layout.addLayout(row2)
-
-        self.layout.addLayout(options_layout)
-        self.layout.addStretch()
-
-        # Generate Button
-        generate_btn = QPushButton("Generate New Password")
-        generate_btn.setMinimumHeight(50)
-        generate_btn.setStyleSheet("font-size: 16px;")
-        generate_btn.clicked.connect(self.generate_password)
-        self.layout.addWidget(generate_btn)
-
-    def update_length_label(self, value):
-        self.length_value_label.setText(str(value))
-
-    def generate_password(self):
-        length = self.length_slider.value()
-        use_upper = self.chk_upper.isChecked()
-        use_lower = self.chk_lower.isChecked()
-        use_numbers = self.chk_numbers.isChecked()
-        use_symbols = self.chk_symbols.isChecked()
-
-        # Prevent unchecking all
-        if not any([use_upper, use_lower, use_numbers, use_symbols]):
-            self.chk_lower.setChecked(True)
-            use_lower = True
-
-        pwd = PasswordGenerator.generate(length, use_upper, use_lower, use_numbers, use_symbols)
-        self.password_display.setText(pwd)
-        self._update_strength_meter(pwd)
-
-    def _update_strength_meter(self, password):
-        score, label = PasswordGenerator.calculate_strength(password)
-        
-        # Color & Value
-        colors = {
-            0: "#ff3b30", # Red
-            1: "#ff9500", # Orange
-            2: "#ffcc00", # Yellow
-            3: "#34c759", # Green
-            4: "#30b0c7"  # Teal/Blue-Green
-        }
-        color = colors.get(score, "#e5e5ea")
-        
-        # Animate value slightly? No, just set it.
-        # Map 0-4 to 20, 40, 60, 80, 100
-        val = (score + 1) * 20
-        
-        self.strength_bar.setValue(val)
-        self.strength_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: none;
-                background-color: #e5e5ea;
-                border-radius: 4px;
-                height: 8px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 4px;
-            }}
-        """)
-        
-        self.strength_label.setText(f"Strength: {label}")
-        self.strength_label.setStyleSheet(f"font-size: 12px; font-weight: bold; color: {color};")
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def pop(self) -> str:
+        with self._condition:
+            if self._error is not None:
+                raise RuntimeError("PasswordReservoir refill thread failed") from self._error
+            if self.ttl is not None:
+                self._expire(time.monotonic())
+            entry = self._entries.popleft() if self._entries else None
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            if len(self._entries) < self.low_water:
+                self._condition.notify()
+        if entry is None:
+            return _sample_policy(self.policy, 1).decode("ascii")
+        buffer = entry[1]
+        password = buffer.decode("ascii")
+        buffer[:] = bytes(len(buffer))
+        return password
+
+    def close(self):
+        """Stops the refill thread and wipes every remaining entry."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        with self._condition:
+            while self._entries:
+                _, buffer = self._entries.popleft()
+                buffer[:] = bytes(len(buffer))
+
+    def __enter__(self) -> "PasswordReservoir":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _expire(self, now: float):
+        entries = self._entries
+        while entries and entries[0][0] <= now:
+            _, buffer = entries.popleft()
+            buffer[:] = bytes(len(buffer))
+            self.expired += 1
+
+    def _refill_loop(self):
+        try:
+            self._refill()
+        except Exception as exc:
+            with self._condition:
+                self._error = exc
+
+    def _refill(self):
+        # Wake up periodically even when idle so expired entries get wiped promptly
+        sweep = None if self.ttl is None else max(self.ttl / 4, 0.01)
+        length = self.policy.length
+        while True:
+            with self._condition:
+                while not self._closed and len(self._entries) >= self.low_water:
+                    if not self._condition.wait(sweep):
+                        self._expire(time.monotonic())
+                if self._closed:
+                    return
+                missing = self.capacity - len(self._entries)
+
+            # Generate outside the lock so pop() never waits on the refill
+            data = bytearray(_sample_policy(self.policy, missing))
+            expiry = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+            fresh = [(expiry, data[i:i + length]) for i in range(0, missing * length, length)]
+            data[:] = bytes(len(data))
+            with self._condition:
+                self._entries.extend(fresh[:self.capacity - len(self._entries)])
+
+
+# -----------------------------------------------------------------------------
+# Asynchronous Generation
+# -----------------------------------------------------------------------------
+
+class AsyncPasswordGenerator:
+    """asyncio front end that keeps password generation off the event loop.
+
+    Concurrent `generate` calls for the same policy made within one loop
+    iteration are coalesced into a single generate_many batch; batches larger
+    than `inline_limit` passwords, and every `generate_many` or `stream`
+    chunk, run in `executor` (the loop's default executor if None). Executor
+    work is cut into chunks of at most `chunk_chars` characters so the worker
+    thread yields the GIL back to the loop frequently.
+    """
+
+    def __init__(self, executor=None, inline_limit: int = 256, chunk_chars: int = _STREAM_CHUNK_CHARS):
+        self.executor = executor
+        self.inline_limit = inline_limit
+        self.chunk_chars = chunk_chars
+        self._pending: dict[PasswordPolicy, list[asyncio.Future]] = {}
+
+    async def generate(self, policy: PasswordPolicy = PasswordPolicy()) -> str:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiters = self._pending.setdefault(policy, [])
+        waiters.append(future)
+        if len(waiters) == 1:
+            # Flush on the next iteration, after every caller scheduled in this one has queued up
+            loop.call_soon(self._flush, policy)
+        return await future
+
+    async def generate_many(self, count: int, policy: PasswordPolicy = PasswordPolicy()) -> list[str]:
+        passwords = []
+        async for chunk in self._chunks(policy, count):
+            passwords.extend(chunk)
+        return passwords
+
+    async def stream(self, policy: PasswordPolicy = PasswordPolicy(),
+                     count: int | None = None) -> AsyncIterator[str]:
+        """Async counterpart of `PasswordGenerator.generate_stream`."""
+        async for chunk in self._chunks(policy, count):
+            for password in chunk:
+                yield password
+
+    async def _chunks(self, policy: PasswordPolicy, count: int | None) -> AsyncIterator[list[str]]:
+        loop = asyncio.get_running_loop()
+        chunks = _generate_chunks(policy, count, None, self.chunk_chars)
+        while True:
+            chunk = await loop.run_in_executor(self.executor, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+    def _flush(self, policy: PasswordPolicy):
+        waiters = [w for w in self._pending.pop(policy) if not w.done()]
+        if not waiters:
+            return
+        if len(waiters) <= self.inline_limit:
+            # Runs as a loop callback: an exception escaping here would never reach the waiters
+            try:
+                passwords = self._generate_batch(policy, len(waiters))
+            except Exception as exc:
+                self._fail(waiters, exc)
+            else:
+                self._deliver(waiters, passwords)
+            return
+        loop = asyncio.get_running_loop()
+        batch = loop.run_in_executor(self.executor, self._generate_batch, policy, len(waiters))
+        batch.add_done_callback(lambda done: self._on_batch_done(waiters, done))
+
+    @staticmethod
+    def _generate_batch(policy: PasswordPolicy, count: int) -> list[str]:
+        return [password for chunk in _generate_chunks(policy, count, None, _CHUNK_CHARS) for password in chunk]
+
+    def _on_batch_done(self, waiters: list[asyncio.Future], done: asyncio.Future):
+        if done.exception() is None:
+            self._deliver(waiters, done.result())
+        else:
+            self._fail(waiters, done.exception())
+
+    @staticmethod
+    def _deliver(waiters: list[asyncio.Future], passwords: list[str]):
+        for waiter, password in zip(waiters, passwords):
+            if not waiter.done():
+                waiter.set_result(password)
+
+    @staticmethod
+    def _fail(waiters: list[asyncio.Future], exc: BaseException):
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(exc)
+
+
+# -----------------------------------------------------------------------------
+# Parallel Bulk Generation
+# -----------------------------------------------------------------------------
+
+def _usable_cpus() -> list[int]:
+    """Returns the CPU ids this process may run on."""
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS / Windows
+        return list(range(os.cpu_count() or 1))
+
+
+def _cgroup_cpu_limit() -> float | None:
+    """Returns the container's CPU quota in CPUs (cgroup v2 or v1), or None when unlimited."""
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+    except (OSError, ValueError):
+        return None
+    return quota / period if quota > 0 and period > 0 else None
+
+
+def _available_cpus() -> int:
+    """Returns how many CPUs worth of work this process can actually get.
+
+    `os.cpu_count()` reports the host; the affinity mask and the cgroup CPU
+    quota are what a container is really allowed to use.
+    """
+    count = len(_usable_cpus())
+    limit = _cgroup_cpu_limit()
+    if limit is not None:
+        count = min(count, max(1, math.ceil(limit)))
+    return count
+
+
+# CPU the current worker process was pinned to by `_pin_worker`, if any
+_WORKER_CPU: int | None = None
+
+
+def _pin_worker(cpus):
+    """Pool initializer: pins this worker to the next CPU id from the `cpus` queue."""
+    global _WORKER_CPU
+    cpu = cpus.get()
+    os.sched_setaffinity(0, {cpu})
+    _WORKER_CPU = cpu
+
+
+def _run_task(function, args: tuple):
+    """Calls a worker function returning (result, elapsed) and tags the result with the worker's CPU."""
+    result, elapsed = function(*args)
+    return result, elapsed, _WORKER_CPU
+
+
+def _generate_chunk(count: int, length: int, options: tuple[bool, bool, bool, bool],
+                    engine: str) -> tuple[list[str], float]:
+    """Worker entry point; each process draws from its own os.urandom. Also returns the time taken."""
+    start = time.perf_counter()
+    passwords = PasswordGenerator.generate_many(count, length, *options, engine=engine)
+    return passwords, time.perf_counter() - start
+
+
+def _fill_shared_chunk(name: str, start: int, count: int, length: int, options: tuple[bool, bool, bool, bool],
+                       engine: str) -> tuple[None, float]:
+    """Worker entry point for `BulkGenerator.generate_shared`: writes passwords into shared memory."""
+    began = time.perf_counter()
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        data = _sample_policy(PasswordPolicy(length, *options, engine), count)
+        shm.buf[start * length:(start + count) * length] = data
+    finally:
+        shm.close()
+    return None, time.perf_counter() - began
+
+
+class SharedPasswordBatch(PasswordBatch):
+    """A fixed-stride `PasswordBatch` living in a `multiprocessing.shared_memory` block.
+
+    Workers write into the block by `name`; `close()` zeroes it, releases the
+    mapping and unlinks it. It raises BufferError, leaving the batch intact,
+    while slices or `view`s of the batch are still alive.
+    """
+
+    __slots__ = ("_shm",)
+
+    def __init__(self, count: int, length: int):
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, count * length))
+        super().__init__(self._shm.buf[:count * length], _fixed_offsets(count, length))
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def _share(self) -> memoryview:
+        # Hand out views holding a buffer export on `_data`, so close() can see they are alive
+        return memoryview(pickle.PickleBuffer(self._data))
+
+    def close(self):
+        if self._shm is None:
+            return
+        try:
+            self._data.release()
+        except BufferError:
+            raise BufferError("Release every slice and view of a SharedPasswordBatch before closing it") from None
+        buf = self._shm.buf
+        buf[:] = bytes(len(buf))
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+
+def _timed_read(source, n: int) -> tuple[bytes, float]:
+    start = time.perf_counter()
+    # Copy on the worker thread: a RandomBytePool view is wiped by that thread's next read
+    raw = bytes(_read_random(source, n))
+    return raw, time.perf_counter() - start
+
+
+def _estimate_raw_bytes(charset: Charset, chars: int) -> int:
+    """Random bytes that usually suffice to produce `chars` characters by byte rejection."""
+    return chars * 256 // charset.threshold + chars // 8 + 16
+
+
+class _ChunkTuner:
+    """Sizes chunks so each task takes about `target_seconds`, tracking an EMA of the time per password."""
+
+    def __init__(self, seconds_per_item: float, target_seconds: float, minimum: int, maximum: int):
+        self.target_seconds = target_seconds
+        self.minimum = minimum
+        self.maximum = maximum
+        self.seconds_per_item = seconds_per_item
+
+    @property
+    def size(self) -> int:
+        ideal = self.target_seconds / max(self.seconds_per_item, 1e-12)
+        return int(min(self.maximum, max(self.minimum, ideal)))
+
+    def next_size(self, remaining: int, workers: int) -> int:
+        """`size` for the next chunk, capped so `remaining` items still spread over all `workers`."""
+        share = -(-remaining // workers)
+        return min(remaining, self.size, max(share, self.minimum))
+
+    def observe(self, count: int, elapsed: float):
+        self.seconds_per_item = 0.7 * self.seconds_per_item + 0.3 * (elapsed / count)
+
+
+@dataclass
+class JobStats:
+    """What a BulkGenerator job did; kept in `BulkGenerator.last_stats`."""
+    count: int
+    length: int
+    backend: str
+    workers: int
+    calibrated_chunk_size: int | None = None   # None when a fixed chunk_size was configured
+    chunk_sizes: list[int] = field(default_factory=list)  # In submission order, retries included
+    retries: int = 0
+    elapsed: float = 0.0
+    per_cpu: dict = field(default_factory=dict)  # Pinned CPU id (None if unpinned) -> [passwords, busy seconds]
+
+    @property
+    def passwords_per_second(self) -> float:
+        return self.count / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def cpu_throughput(self) -> dict:
+        """Passwords per busy second for each CPU that ran chunks."""
+        return {cpu: passwords / busy if busy else 0.0 for cpu, (passwords, busy) in self.per_cpu.items()}
+
+
+class BulkGenerator:
+    """Spreads very large generate_many jobs over a pool of workers.
+
+    The job is cut into chunks that workers generate independently; results
+    are reassembled in order. `backend` picks the pool:
+
+    * "process" - each worker process generates whole chunks. Workers always
+      read the operating system CSPRNG: a buffered source or DRBG would be
+      cloned into every worker and repeat its output.
+    * "thread" - worker threads only draw the raw random bytes (os.urandom and
+      hashlib release the GIL), and the calling thread does the cheap
+      translate-and-slice mapping. Works where processes are unavailable and
+      accepts a shared thread-safe `source`; it always uses byte rejection.
+
+    The worker count defaults to the CPUs the process may really use (affinity
+    mask capped by the cgroup CPU quota). With `pin_workers` each worker
+    process is pinned to one of those CPUs, and `last_stats.cpu_throughput`
+    reports throughput per core.
+
+    With `chunk_size=None` the chunk size is tuned per policy: a short timed
+    probe picks a size that makes each task last about `target_task_seconds`
+    (long enough to amortise IPC, short enough to balance load), and measured
+    task times keep adjusting it during the run. Statistics of the last job,
+    including the chosen sizes, are kept in `last_stats`.
+
+    A chunk whose worker raises or dies is regenerated from scratch (on a
+    fresh pool if the old one broke) up to `max_retries` times, so a job
+    either returns exactly `count` passwords or raises - never a partial or
+    duplicated list.
+    """
+
+    BACKENDS = ("process", "thread")
+    MIN_CHUNK = 256
+    MAX_CHUNK = 1_000_000
+
+    def __init__(self, workers: int | None = None, chunk_size: int | None = None, max_retries: int = 2,
+                 backend: str = "process", target_task_seconds: float = 0.05, pin_workers: bool = False):
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend: {backend!r}")
+        self.workers = workers or _available_cpus()
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.backend = backend
+        self.target_task_seconds = target_task_seconds
+        self.pin_workers = pin_workers and hasattr(os, "sched_setaffinity")
+        self.last_stats: JobStats | None = None
+        self._calibration: dict[tuple, float] = {}   # Policy key -> measured seconds per password
+
+    def generate(self, count: int, length: int, use_upper: bool = True, use_lower: bool = True,
+                 use_numbers: bool = True, use_symbols: bool = True, engine: str = "bytes",
+                 source=None) -> list[str]:
+        _get_sampler(engine)  # Fail fast on an unknown engine, before starting any worker
+        options = (use_upper, use_lower, use_numbers, use_symbols)
+        charset = Charset.from_options(*options)
+        threaded = self.backend == "thread"
+        if threaded and engine != "bytes":
+            raise ValueError("The thread backend only supports the 'bytes' engine")
+        if not threaded and source is not None:
+            raise ValueError("The process backend cannot share a randomness source across workers")
+
+        stats = JobStats(count, length, self.backend, self.workers)
+        if threaded and (not charset.size or count <= 0 or length <= 0):
+            # Nothing to draw: answer directly instead of probing or starting any worker
+            self.last_stats = stats
+            return [""] * count
+        tuner = self._tuner(length, options, engine, stats)
+        started = time.perf_counter()
+        if threaded:
+            results = self._run_threads(count, charset, length, source, tuner, stats)
+        else:
+            results = self._run_processes(
+                count, lambda start, n: (_generate_chunk, (n, length, options, engine)), tuner, stats)
+        stats.elapsed = time.perf_counter() - started
+        self.last_stats = stats
+
+        passwords = []
+        for chunk in results:
+            passwords.extend(chunk)
+        return passwords
+
+    def generate_shared(self, count: int, length: int, use_upper: bool = True, use_lower: bool = True,
+                        use_numbers: bool = True, use_symbols: bool = True,
+                        engine: str = "bytes") -> "SharedPasswordBatch":
+        """Like `generate`, but workers write straight into one shared memory block.
+
+        Password `i` occupies bytes `[i * length, (i + 1) * length)`, so nothing
+        is pickled back to the parent and no `str` is built until an item of
+        the returned batch is read. Always uses worker processes.
+        """
+        _get_sampler(engine)
+        options = (use_upper, use_lower, use_numbers, use_symbols)
+        if not Charset.from_options(*options).size:
+            length = 0
+        stats = JobStats(count, length, "process", self.workers)
+        batch = SharedPasswordBatch(count, length)
+        try:
+            if count and length:
+                tuner = self._tuner(length, options, engine, stats)
+                started = time.perf_counter()
+                self._run_processes(
+                    count, lambda start, n: (_fill_shared_chunk, (batch.name, start, n, length, options, engine)),
+                    tuner, stats)
+                stats.elapsed = time.perf_counter() - started
+        except BaseException:
+            batch.close()
+            raise
+        self.last_stats = stats
+        return batch
+
+    def _tuner(self, length: int, options, engine: str, stats: JobStats) -> _ChunkTuner:
+        if self.chunk_size is not None:
+            # Fixed size: a tuner whose bounds pin it to the configured value
+            return _ChunkTuner(1.0, float(self.chunk_size), self.chunk_size, self.chunk_size)
+
+        key = (self.backend, length, options, engine)
+        if key not in self._calibration:
+            self._calibration[key] = self._probe(length, options, engine)
+        tuner = _ChunkTuner(self._calibration[key], self.target_task_seconds, self.MIN_CHUNK, self.MAX_CHUNK)
+        stats.calibrated_chunk_size = tuner.size
+        return tuner
+
+    def _probe(self, length: int, options, engine: str) -> float:
+        """Times generate_many in-process, doubling the batch until it runs for at least 10 ms."""
+        count = 256
+        while True:
+            start = time.perf_counter()
+            PasswordGenerator.generate_many(count, length, *options, engine=engine)
+            elapsed = time.perf_counter() - start
+            if elapsed >= 0.01 or count >= self.MAX_CHUNK:
+                return elapsed / count
+            count *= 2
+
+    def _run_processes(self, count: int, task, tuner: _ChunkTuner, stats: JobStats) -> list:
+        """Runs `task(start, n) -> (function, args)` for every chunk; returns the results in order.
+
+        Each submitted function must return `(result, elapsed_seconds)`.
+        """
+        results: dict[int, object] = {}
+        failures: dict[int, int] = {}
+        retry: deque[tuple[int, int]] = deque()
+        next_start = 0
+        window = 2 * self.workers
+
+        while next_start < count or retry:
+            with self._process_pool() as pool:
+                in_flight: dict = {}
+                broken = False
+
+                def submit_next() -> bool:
+                    nonlocal next_start
+                    if retry:
+                        start, n = retry.popleft()
+                    elif next_start < count:
+                        start, n = next_start, tuner.next_size(count - next_start, self.workers)
+                        next_start += n
+                    else:
+                        return False
+                    stats.chunk_sizes.append(n)
+                    in_flight[pool.submit(_run_task, *task(start, n))] = (start, n)
+                    return True
+
+                while len(in_flight) < window and submit_next():
+                    pass
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        start, n = in_flight.pop(future)
+                        try:
+                            result, elapsed, cpu = future.result()
+                        except Exception as exc:
+                            broken = broken or isinstance(exc, BrokenProcessPool)
+                            self._record_failure(failures, start, exc, in_flight, stats)
+                            retry.append((start, n))
+                            continue
+                        results[start] = result
+                        tuner.observe(n, elapsed)
+                        totals = stats.per_cpu.setdefault(cpu, [0, 0.0])
+                        totals[0] += n
+                        totals[1] += elapsed
+                    # A broken pool fails everything still queued; drain it and start a fresh one
+                    while not broken and len(in_flight) < window and submit_next():
+                        pass
+        return [results[start] for start in sorted(results)]
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if not self.pin_workers:
+            return ProcessPoolExecutor(max_workers=self.workers)
+        cpus = _usable_cpus()
+        queue = multiprocessing.Queue()
+        for i in range(self.workers):
+            queue.put(cpus[i % len(cpus)])
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_pin_worker, initargs=(queue,))
+
+    def _run_threads(self, count: int, charset: Charset, length: int, source,
+                     tuner: _ChunkTuner, stats: JobStats) -> list[list[str]]:
+        results = []
+        failures: dict[int, int] = {}
+        window = 2 * self.workers  # Raw buffers in flight; bounds memory to a few chunks per thread
+        in_flight: deque = deque()
+        next_start = 0
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            def draw(start: int, n: int):
+                stats.chunk_sizes.append(n)
+                return pool.submit(_timed_read, source, _estimate_raw_bytes(charset, n * length))
+
+            def submit_next():
+                nonlocal next_start
+                n = tuner.next_size(count - next_start, self.workers)
+                in_flight.append((next_start, n, draw(next_start, n)))
+                next_start += n
+
+            while len(in_flight) < window and next_start < count:
+                submit_next()
+            while in_flight:
+                start, n, future = in_flight.popleft()
+                while True:
+                    try:
+                        raw, elapsed = future.result()
+                        break
+                    except Exception as exc:
+                        self._record_failure(failures, start, exc, [f for _, _, f in in_flight], stats)
+                        future = draw(start, n)
+                if next_start < count:
+                    submit_next()
+
+                # Time the mapping too: the calibration probe timed reading and mapping together
+                converting = time.perf_counter()
+                need = n * length
+                mapped = raw.translate(charset.table, charset.rejected)
+                if len(mapped) < need:
+                    mapped += _sample_bytes(charset, need - len(mapped), source)
+                text = mapped[:need].decode("ascii")
+                results.append([text[j:j + length] for j in range(0, need, length)])
+                tuner.observe(n, elapsed + time.perf_counter() - converting)
+        return results
+
+    def _record_failure(self, failures: dict[int, int], start: int, exc: Exception, outstanding, stats: JobStats):
+        """Counts a failed attempt at the chunk at `start`; past `max_retries`, cancels `outstanding` and raises."""
+        failures[start] = failures.get(start, 0) + 1
+        stats.retries += 1
+        if failures[start] > self.max_retries:
+            for future in list(outstanding):
+                future.cancel()
+            raise RuntimeError(f"Chunk at offset {start} failed {failures[start]} times") from exc
 
-    def copy_to_clipboard(self):
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.password_display.text())
-        
-        # Flash effect
-        original_style = self.password_display.styleSheet()
-        self.password_display.setStyleSheet("""
-            QLineEdit {
-                background-color: #d1f7c4; 
-                border: 1px solid #34c759;
-                border-radius: 8px;
-                padding: 10px;
-                font-family: 'Courier New';
-                font-size: 18px;
-                color: #1d1d1f;
-            }
-        """)
-        QTimer.singleShot(200, lambda: self._reset_display_style())
-
-    def _reset_display_style(self):
-        # Revert to default style defined in _apply_styles via global stylesheet 
-        # or specific widget override. Since we used gloabl CSS for QLineEdit, 
-        # setting empty string here might reverting to parent/app style? 
-        # Actually explicit setStyleSheet overrides app style. verify.
-        # It's safer to re-apply the specific desired style or just clear if it falls back correctly.
-        # Let's just re-apply the input style from _apply_styles
-        self.password_display.setStyleSheet("""
-            QLineEdit {
-                background-color: #ffffff;
-                border: 1px solid #d1d1d6;
-                border-radius: 8px;
-                padding: 10px;
-                font-family: 'Courier New';
-                font-size: 18px;
-                color: #1d1d1f;
-            }
-        """)
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = PasswordGeneratorApp()
-    window.show()
-    sys.exit(app.exec())
+    # The GUI lives in its own module so that library users and worker processes never import Qt
+    from password_generator_gui import main
+    main()
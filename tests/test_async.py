@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import pytest
+
+from password_generator import AsyncPasswordGenerator, PasswordPolicy
+
+# Event-loop lag budget while a bulk request is being served
+LAG_BUDGET_SECONDS = 0.020
+
+
+def _run(coro, timeout: float = 30.0):
+    return asyncio.run(asyncio.wait_for(coro, timeout))
+
+
+@pytest.mark.parametrize("inline_limit", [256, 0])
+def test_coalesced_requests_share_one_batch(monkeypatch, inline_limit):
+    calls = []
+    generate_batch = AsyncPasswordGenerator._generate_batch
+
+    def record(policy, count):
+        calls.append((policy, count))
+        return generate_batch(policy, count)
+
+    monkeypatch.setattr(AsyncPasswordGenerator, "_generate_batch", staticmethod(record))
+
+    async def run():
+        generator = AsyncPasswordGenerator(inline_limit=inline_limit)
+        return await asyncio.gather(*(generator.generate(PasswordPolicy(12)) for _ in range(100)))
+
+    passwords = _run(run())
+    assert calls == [(PasswordPolicy(12), 100)]
+    assert len(passwords) == 100 and all(len(p) == 12 for p in passwords)
+    assert len(set(passwords)) == 100
+
+
+@pytest.mark.parametrize("inline_limit", [256, 0])
+def test_generation_errors_reach_every_waiter(inline_limit):
+    # Four required classes cannot fit in two characters; inline_limit=0 takes the executor path
+    policy = PasswordPolicy(2, require_each_class=True)
+
+    async def run():
+        generator = AsyncPasswordGenerator(inline_limit=inline_limit)
+        return await asyncio.gather(*(generator.generate(policy) for _ in range(3)), return_exceptions=True)
+
+    results = _run(run(), timeout=5.0)
+    assert len(results) == 3 and all(isinstance(r, ValueError) for r in results)
+
+
+def test_bulk_generation_keeps_event_loop_responsive(count: int = 1_000_000, tick: float = 0.001):
+    async def run():
+        generator = AsyncPasswordGenerator()
+        lags = []
+
+        async def ticker():
+            while True:
+                start = time.perf_counter()
+                await asyncio.sleep(tick)
+                lags.append(time.perf_counter() - start - tick)
+
+        ticker_task = asyncio.create_task(ticker())
+        passwords = await generator.generate_many(count)
+        ticker_task.cancel()
+        return passwords, lags
+
+    passwords, lags = _run(run(), timeout=120.0)
+    assert len(passwords) == count
+    lags.sort()
+    assert lags, "the ticker never ran while passwords were generated"
+    assert lags[int(len(lags) * 0.99)] <= LAG_BUDGET_SECONDS
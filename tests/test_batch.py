@@ -0,0 +1,105 @@
+import io
+import string
+from array import array
+
+import pytest
+
+from password_generator import PasswordBatch, PasswordGenerator, PasswordPolicy
+
+PRINTABLE = set(string.ascii_letters + string.digits + string.punctuation)
+
+
+@pytest.fixture
+def batch():
+    return PasswordGenerator.generate_batch(10, PasswordPolicy(8))
+
+
+def test_items_are_passwords_of_the_policy(batch):
+    assert len(batch) == 10
+    items = list(batch)
+    assert [batch[i] for i in range(10)] == items
+    assert all(len(item) == 8 and set(item) <= PRINTABLE for item in items)
+    assert len(set(items)) == 10
+    assert batch.nbytes == 80
+    assert batch.tobytes() == "".join(items).encode("ascii") == bytes(batch.view)
+
+
+def test_negative_and_out_of_range_indexing(batch):
+    assert batch[-1] == batch[9] and batch[-10] == batch[0]
+    for index in (10, -11, 100):
+        with pytest.raises(IndexError):
+            batch[index]
+
+
+def test_slices(batch):
+    items = list(batch)
+    assert list(batch[2:5]) == items[2:5]
+    assert list(batch[-3:]) == items[-3:]
+    assert list(batch[:100]) == items
+    for empty in (batch[5:2], batch[4:4], batch[20:30]):
+        assert len(empty) == 0 and list(empty) == [] and empty.tobytes() == b""
+    with pytest.raises(ValueError):
+        batch[::2]
+    with pytest.raises(ValueError):
+        batch[::-1]
+
+
+def test_slices_share_the_buffer(batch):
+    items = list(batch)
+    batch[2:4].wipe()
+    assert batch[2] == batch[3] == "\0" * 8
+    assert [batch[i] for i in range(10) if i not in (2, 3)] == items[:2] + items[4:]
+
+
+def test_context_manager_wipes(batch):
+    with batch as inside:
+        assert inside is batch
+    assert batch.tobytes() == bytes(80)
+
+
+@pytest.mark.parametrize("items_per_write", [1, 3, 4096])
+def test_writeto_with_separator(batch, items_per_write):
+    out = io.BytesIO()
+    written = batch.writeto(out, items_per_write=items_per_write)
+    assert written == len(out.getvalue()) == 90
+    assert out.getvalue().decode("ascii").split("\n") == list(batch) + [""]
+    out = io.BytesIO()
+    assert batch.writeto(out, sep=b", ") == 100
+    assert out.getvalue() == b"".join(item.encode("ascii") + b", " for item in batch)
+
+
+def test_writeto_without_separator(batch):
+    out = io.BytesIO()
+    assert batch.writeto(out, sep=b"") == 80
+    assert out.getvalue() == batch.tobytes()
+
+
+def test_variable_offsets():
+    batch = PasswordBatch(bytearray(b"abcdefgh"), array("I", [0, 1, 1, 4, 8]))
+    assert list(batch) == ["a", "", "bcd", "efgh"]
+    assert list(batch[1:3]) == ["", "bcd"] and batch[1:3].nbytes == 3
+
+
+@pytest.mark.parametrize("policy", [PasswordPolicy(0), PasswordPolicy(8, False, False, False, False)])
+def test_zero_length_policies(policy):
+    batch = PasswordGenerator.generate_batch(5, policy)
+    assert len(batch) == 5 and list(batch) == [""] * 5
+    assert batch.nbytes == 0 and batch.tobytes() == b""
+    out = io.BytesIO()
+    assert batch.writeto(out) == 5 and out.getvalue() == b"\n" * 5
+    assert len(PasswordGenerator.generate_batch(0, PasswordPolicy(8))) == 0
+
+
+def test_generate_into():
+    buf = bytearray(20)
+    assert PasswordGenerator.generate_into(buf, PasswordPolicy(8), 2) == 16
+    assert set(buf[:16].decode("ascii")) <= PRINTABLE and buf[16:] == bytes(4)
+    with pytest.raises(ValueError):
+        PasswordGenerator.generate_into(bytearray(15), PasswordPolicy(8), 2)
+    with pytest.raises(TypeError):
+        PasswordGenerator.generate_into(bytes(16), PasswordPolicy(8), 2)
+
+
+@pytest.mark.parametrize("policy", [PasswordPolicy(0), PasswordPolicy(8, False, False, False, False)])
+def test_generate_into_zero_length_policies(policy):
+    assert PasswordGenerator.generate_into(bytearray(0), policy, 2) == 0
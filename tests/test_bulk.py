@@ -0,0 +1,85 @@
+from collections import Counter
+from multiprocessing import shared_memory
+
+import pytest
+
+import password_generator
+from password_generator import BulkGenerator, RandomBytePool, ShakeDRBG
+
+
+def test_thread_backend_with_pooled_source_is_not_corrupted():
+    # Pool reads are views the worker thread wipes on its next read; they must be copied in the worker
+    passwords = BulkGenerator(workers=2, backend="thread", chunk_size=256).generate(20000, 16, source=RandomBytePool())
+    assert len(passwords) == 20000
+    assert "A" * 16 not in passwords
+    assert len(set(passwords)) == 20000
+
+
+def test_thread_backend_with_shared_drbg():
+    passwords = BulkGenerator(workers=4, backend="thread", chunk_size=512).generate(
+        20000, 16, source=ShakeDRBG(block_size=4096))
+    assert len(set(passwords)) == 20000
+    # Every printable character shows up at roughly 1/94 of the positions
+    counts = Counter("".join(passwords))
+    assert len(counts) == 94 and max(counts.values()) < 2 * min(counts.values())
+
+
+def test_mid_size_jobs_spread_over_all_workers():
+    bulk = BulkGenerator(workers=2)
+    assert len(bulk.generate(100000, 12)) == 100000
+    chunk_sizes = bulk.last_stats.chunk_sizes
+    assert sum(chunk_sizes) == 100000
+    assert len(chunk_sizes) >= 2 and max(chunk_sizes) <= 50000
+
+
+@pytest.mark.parametrize("count, length, options", [
+    (5, 0, (True, True, True, True)),
+    (0, 16, (True, True, True, True)),
+    (5, 16, (False, False, False, False)),
+])
+def test_thread_backend_empty_jobs_never_start_processes(monkeypatch, count, length, options):
+    def refuse(*args, **kwargs):
+        raise AssertionError("The thread backend must not start a process pool")
+
+    monkeypatch.setattr(password_generator, "ProcessPoolExecutor", refuse)
+    monkeypatch.setattr(BulkGenerator, "_probe", refuse)
+    bulk = BulkGenerator(workers=2, backend="thread")
+    assert bulk.generate(count, length, *options) == [""] * count
+    assert bulk.generate(count, length, *options, source=ShakeDRBG()) == [""] * count
+    assert bulk.last_stats.backend == "thread"
+
+
+def test_generate_shared_fills_and_unlinks_the_segment():
+    batch = BulkGenerator(workers=2, chunk_size=1000).generate_shared(5000, 12)
+    passwords = list(batch)
+    assert len(passwords) == 5000 and len(set(passwords)) == 5000
+    assert all(len(password) == 12 for password in passwords)
+    name = batch.name
+    batch.close()
+    batch.close()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_shared_batch_refuses_to_close_under_live_slices():
+    batch = BulkGenerator(workers=2).generate_shared(100, 8)
+    head, view = batch[:10], batch.view
+    first = list(head)
+    with pytest.raises(BufferError):
+        batch.close()
+    del view
+    with pytest.raises(BufferError):
+        batch.close()
+    assert list(head) == first and batch[0] == first[0]
+    del head
+    batch.close()
+
+
+def test_thread_backend_tuner_sees_the_mapping_time(monkeypatch):
+    # With reads reported as free, whatever the tuner observes is the main-thread mapping work
+    observed = []
+    read = password_generator._timed_read
+    monkeypatch.setattr(password_generator, "_timed_read", lambda source, n: (read(source, n)[0], 0.0))
+    monkeypatch.setattr(password_generator._ChunkTuner, "observe", lambda self, n, elapsed: observed.append(elapsed))
+    BulkGenerator(workers=2, backend="thread", chunk_size=4096).generate(20000, 16)
+    assert len(observed) == 5 and all(elapsed > 0 for elapsed in observed)
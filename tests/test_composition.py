@@ -0,0 +1,101 @@
+import itertools
+from collections import Counter
+
+import pytest
+
+from password_generator import PasswordGenerator, PasswordPolicy, _composition_plan
+
+# Synthetic classes for brute force; the plan only depends on the class sizes
+ALPHABETS = ("ab", "cde", "f")
+CLASS_TESTS = {
+    "upper": str.isupper,
+    "lower": str.islower,
+    "numbers": str.isdigit,
+    "symbols": lambda c: not c.isalnum(),
+}
+
+
+def _brute_force_total(bounds, length):
+    alphabet = "".join(ALPHABETS)
+    total = 0
+    for chars in itertools.product(alphabet, repeat=length):
+        counts = [sum(c in letters for c in chars) for letters in ALPHABETS]
+        total += all(low <= k <= high for k, (low, high) in zip(counts, bounds))
+    return total
+
+
+def _chi_square_ok(counter, outcomes, samples):
+    # Loose bound (mean + 6 standard deviations) so only real skews fail
+    expected = samples / outcomes
+    missing = outcomes - len(counter)
+    statistic = sum((n - expected) ** 2 / expected for n in counter.values()) + missing * expected
+    return statistic < outcomes + 6 * (2 * outcomes) ** 0.5
+
+
+@pytest.mark.parametrize("length", range(0, 6))
+def test_plan_total_matches_enumeration_for_coverage(length):
+    bounds = ((1, length),) * len(ALPHABETS)
+    expected = _brute_force_total(bounds, length)
+    sizes = tuple(len(a) for a in ALPHABETS)
+    if expected:
+        assert _composition_plan(sizes, bounds, length).total == expected
+    else:
+        with pytest.raises(ValueError):
+            _composition_plan(sizes, bounds, length)
+
+
+@pytest.mark.parametrize("length", range(4, 17, 4))
+def test_every_class_appears(length):
+    policy = PasswordPolicy(length, require_each_class=True)
+    for password in PasswordGenerator.generate_stream(policy, 2000):
+        assert len(password) == length
+        assert all(any(test(c) for c in password) for test in CLASS_TESTS.values())
+
+
+def test_coverage_is_uniform():
+    # Digits and symbols with both required at length 2: 2 * 10 * 32 = 640 passwords
+    policy = PasswordPolicy(2, False, False, True, True, require_each_class=True)
+    samples = 64_000
+    counter = Counter(PasswordGenerator.generate_stream(policy, samples))
+    assert len(counter) == 640
+    assert _chi_square_ok(counter, 640, samples)
+
+
+@pytest.mark.parametrize("bounds", [((0, 0), (2, 2), (1, 3)), ((1, 2), (0, 5), (0, 0)), ((0, 1), (1, 1), (0, 5))])
+@pytest.mark.parametrize("length", range(1, 6))
+def test_plan_total_matches_enumeration_for_quotas(bounds, length):
+    expected = _brute_force_total(bounds, length)
+    sizes = tuple(len(a) for a in ALPHABETS)
+    if expected:
+        assert _composition_plan(sizes, bounds, length).total == expected
+    else:
+        with pytest.raises(ValueError):
+            _composition_plan(sizes, bounds, length)
+
+
+def test_quota_passwords_have_exact_counts():
+    policy = PasswordPolicy(12, quotas={"numbers": 3, "symbols": (1, 2), "upper": 0})
+    for password in PasswordGenerator.generate_stream(policy, 2000):
+        assert sum(map(CLASS_TESTS["numbers"], password)) == 3
+        assert 1 <= sum(map(CLASS_TESTS["symbols"], password)) <= 2
+        assert not any(map(CLASS_TESTS["upper"], password))
+
+
+def test_quotas_are_uniform():
+    # Digits + symbols, length 2, one or two digits: 2 * 10 * 32 + 10**2 = 740 passwords
+    policy = PasswordPolicy(2, False, False, True, True, quotas={"numbers": (1, 2)})
+    samples = 74_000
+    counter = Counter(PasswordGenerator.generate_stream(policy, samples))
+    assert len(counter) == 740
+    assert _chi_square_ok(counter, 740, samples)
+
+
+@pytest.mark.parametrize("quotas", [{"nums": 1}, {"numbers": (3, 1)}, {"numbers": -1}])
+def test_invalid_quotas_are_rejected(quotas):
+    with pytest.raises(ValueError):
+        PasswordPolicy(quotas=quotas)
+
+
+def test_quota_on_deselected_class_is_rejected():
+    with pytest.raises(ValueError):
+        PasswordPolicy(use_numbers=False, quotas={"numbers": 2})
@@ -0,0 +1,9 @@
+import pytest
+
+from password_generator import PasswordGenerator
+
+
+@pytest.mark.parametrize("engine", PasswordGenerator.ENGINES)
+@pytest.mark.parametrize("length", [-1, 0])
+def test_non_positive_length_gives_empty_password(engine, length):
+    assert PasswordGenerator.generate(length, True, True, True, True, engine=engine) == ""
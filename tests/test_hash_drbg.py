@@ -0,0 +1,198 @@
+"""Hash_DRBG known-answer tests.
+
+Vectors are from NIST CAVP (CAVS 14.3, `Hash_DRBG.rsp` and
+`Hash_DRBG_no_reseed.rsp`, prediction resistance false): instantiate,
+optionally reseed, generate twice and compare the second output.
+"""
+import pytest
+
+import password_generator
+from password_generator import HashDRBG
+
+VECTORS = [
+    {
+        "hash": "sha256",
+        "entropy": "a65ad0f345db4e0effe875c3a2e71f42c7129d620ff5c119a9ef55f05185e0fb",
+        "nonce": "8581f9317517276e06e9607ddbcbcc2e",
+        "personalization": "",
+        "additional_1": "",
+        "additional_2": "",
+        "returned": (
+            "d3e160c35b99f340b2628264d1751060e0045da383ff57a57d73a673d2b8d80d"
+            "aaf6a6c35a91bb4579d73fd0c8fed111b0391306828adfed528f018121b3febd"
+            "c343e797b87dbb63db1333ded9d1ece177cfa6b71fe8ab1da46624ed6415e51c"
+            "cde2c7ca86e283990eeaeb91120415528b2295910281b02dd431f4c9f70427df"
+        ),
+    },
+    {
+        "hash": "sha256",
+        "entropy": "68c43a008fe46a823d260a9d7fa388fb9e401f0197e7e758a744b4babb3f4651",
+        "nonce": "eb6825777856331884aaf3751b3e4006",
+        "personalization": "23ce0d32cbf2d26467f0d62acff1a3acbaa6d2746dc3ee7aa9d32c880788afc8",
+        "additional_1": "a31b9f13b58d4fa2f8d8ac42b62a207ff647339a146bd8b268b33d4aff57adbd",
+        "additional_2": "d34fc6504eca4b568193c75357b0d3821a48c77ff80d6dbd21c6cf045ff489cf",
+        "returned": (
+            "abb4ecbacd4e8fa943c7221aed433861c3b203232657ec4c417d021f905d911d"
+            "b1058ff1e11e272232482ec96bae7cb4efc135502dbe41724077077f6de79b71"
+            "3670c385d04644e1281c3e582e0016255abbe5f8c06d0de57160559f0c08f7fb"
+            "5be3563c649966190f8d3261364447537de2c7371c6e8c308933d27145bf90ab"
+        ),
+    },
+    {
+        "hash": "sha512",
+        "entropy": "6b50a7d8f8a55d7a3df8bb40bcc3b722d8708de67fda010b03c4c84d72096f8c",
+        "nonce": "3ec649cc6256d9fa31db7a2904aaf025",
+        "personalization": "",
+        "additional_1": "",
+        "additional_2": "",
+        "returned": (
+            "95b7f17e9802d3577392c6a9c08083b67dd1292265b5f42d237f1c55bb9b10bf"
+            "cfd82c77a378b8266a0099143b3c2d64611eeeb69acdc055957c139e8b190c7a"
+            "06955f2c797c2778de940396a501f40e91396acf8d7e45ebdbb53bbf8c975230"
+            "d2f0ff9106c76119ae498e7fbc03d90f8e4c51627aed5c8d4263d5d2b978873a"
+            "0de596ee6dc7f7c29e37eee8b34c90dd1cf6a9ddb22b4cbd086b14b35de93da2"
+            "d5cb1806698cbd7bbb67bfe3d31fd2d1dbd2a1e058a3eb99d7e51f1a938eed5e"
+            "1c1de23a6b4345d3191409f92f39b3670d8dbfb635d8e6a36932d81033d1448d"
+            "63b403ddf88e121b6e819ac381226c1321e4b08644f6727c368c5a9f7a4b3ee2"
+        ),
+    },
+    {
+        "hash": "sha512",
+        "entropy": "31e8d6fbdc9026b0708405c20b558fcc0a107f3fdc836fe056f020df30d9dc57",
+        "nonce": "2b8bbab9b486abb659c4ae8ff5978e22",
+        "personalization": "949eb753762869aa5ea0ce725523595f9bc9b219735113e71feab228d0872c38",
+        "additional_1": "88f1180d4ef564315280a9692f107ed9c0639d79bb7040dfc3b7d58bf24ef8f5",
+        "additional_2": "f4fc8a26e0ad181838f1399fe5b8a4b86670e92ab92b2c4daf3913470724d3f2",
+        "returned": (
+            "10509641332a4d72a3c5936512c37cb9ab9874693902ee4c76e963675627ef86"
+            "aa2e7d7029a152b800072fc53eeb6b41d12f481cde99b467dac3486836f6e146"
+            "e9a79d3fb90d9b26f213ddbfac590ca083ed83fde4924395d25b645b96a6983e"
+            "65fd662cae66112ebfa990f09b86b01270b7f0ef35f183eb01ffcbd7d5ec6adc"
+            "4839cf3814dac858e013c6d79528ef273dd83724ccdc82b73dc63698fcf8ef09"
+            "24f27b6a49d6d38f0ce261aa5a0a88779e47a413c29e1d7d20e4ab914bbabd5e"
+            "6e0241cf53263a8efa321b4a632eb062b255c0ce5a0833114161dd073dd03796"
+            "7a1f03daf2dd7e927b801b40e62f26c0872ea100132807650232126aa8f29d70"
+        ),
+    },
+    {
+        "hash": "sha256",
+        "entropy": "63363377e41e86468deb0ab4a8ed683f6a134e47e014c700454e81e95358a569",
+        "nonce": "808aa38f2a72a62359915a9f8a04ca68",
+        "personalization": "",
+        "entropy_reseed": "e62b8a8ee8f141b6980566e3bfe3c04903dad4ac2cdf9f2280010a6739bc83d3",
+        "additional_reseed": "",
+        "additional_1": "",
+        "additional_2": "",
+        "returned": (
+            "04eec63bb231df2c630a1afbe724949d005a587851e1aa795e477347c8b05662"
+            "1c18bddcdd8d99fc5fc2b92053d8cfacfb0bb8831205fad1ddd6c071318a6018"
+            "f03b73f5ede4d4d071f9de03fd7aea105d9299b8af99aa075bdb4db9aa28c18d"
+            "174b56ee2a014d098896ff2282c955a81969e069fa8ce007a180183a07dfae17"
+        ),
+    },
+    {
+        "hash": "sha256",
+        "entropy": "6c623aea73bc8a59e28c6cd9c7c7ec8ca2e75190bd5dcae5978cf0c199c23f4f",
+        "nonce": "e55db067a0ed537e66886b7cda02f772",
+        "personalization": "1e59d798810083d1ff848e90b25c9927e3dfb55a0888b0339566a9f9ca7542dc",
+        "entropy_reseed": "9ab40164744c7d00c78b4196f6f917ec33d70030a0812cd4606c5a25387568a9",
+        "additional_reseed": "4e8bead7cbba7a7bc9ae1e1617222c4139661347599950e7225d1e2faa5d57f5",
+        "additional_1": "dcb22a5d9f149858636f3ede2253e419816fb7b1103194451ed6a573a8fe6271",
+        "additional_2": "8f9d5c78cdabc32e71ac3b3c49239caddf96053250f4fd92056efbd0be487d36",
+        "returned": (
+            "6e98a3b1f686f6ffa79355c9d8a5ab7f93312159d52659a2298315f10007c71a"
+            "dabc0b5ccb4164c0949fbdb221b43acdb62bed3099596f2d7bd5d0048173dd23"
+            "60a543b234ab61a441ddb9299af84ca45c6e618fd521366dbf509d4ec06174da"
+            "924361d642b107e5564ac1b32340dd2f3158bf4c00bcb4dcf12c6d67af4b74ee"
+        ),
+    },
+    {
+        "hash": "sha512",
+        "entropy": "3144e17a10c856129764f58fd8e4231020546996c0bf6cff8e91c24ee09be333",
+        "nonce": "b16fcb1cf0c010f31feab733588b8e04",
+        "personalization": "",
+        "entropy_reseed": "a0b3584c2c8412f618406834404d1eb0ce999ba28966054d7e497e0db608b967",
+        "additional_reseed": "",
+        "additional_1": "",
+        "additional_2": "",
+        "returned": (
+            "efa35dd0362adb7626456b36fac74d3c28d01d926420275a28bea9c9dd7547c1"
+            "5e7931852ac1277076567535239c1f429c7f75cf74c2267deb6a3e596cf32615"
+            "6c796941283b8d583f171c2f6e3323f7555e1b181ffda30507210cb1f589b23c"
+            "d71880fd44370cacf43375b0db7e336f12b309bfd4f610bb8f20e1a15e253a4f"
+            "e511a027968df0b105a1d73aff7c7a826d39f640dfb8f522259ed402282e2c2e"
+            "9d3a498f51725fe4141b06da5598a42ac1e0494e997d566a1a39b676b96a6003"
+            "a4c5db84f246584ee65af70ff2160278166da16d91c9b8f2deb02751a1088ad6"
+            "be4e80ef966eb73e66bc87cad87c77c0b34a21ba1da0ba6d16ca5046dc4abda0"
+        ),
+    },
+    {
+        "hash": "sha512",
+        "entropy": "4b23595b0a3640cfabb0ec34df6a613308b0448488a5d9ff99da4278e072eb34",
+        "nonce": "8e696bffd9ca3a71d2e2f05e600c8364",
+        "personalization": "010ba93ea68a3d4a200e5145859e299c5b5349b7645fb5bbcad687aba7d67313",
+        "entropy_reseed": "04de4babdbe143bde99aa4452f9aa43b0a164eb927555c0496aa0fc9328a521c",
+        "additional_reseed": "2b0c7c3efb36b71b917a44086d168313675b426b17c5ab3d0eb6af753f6040e0",
+        "additional_1": "d0b7d1d12ab15d3bba8f4eba07fee0974838962b247be480683b8e3d4a91033a",
+        "additional_2": "66c78ca12e45bdca003b49cb6440b977dd85b167e7c803890ed1a73666eaa869",
+        "returned": (
+            "4008cbd8281dc82fd6c368f650ef2609bb771e80c63d478a77fa938248dcbb8b"
+            "79e54ead0265f6ff1ebfafe4e387c6e27df9f03e4a5225e86a4436e56ebf03b3"
+            "be2cfbcb49c89c92ec1dfa5ee445dd4f6f64e02a2423a0b18ebd02eec52f5cc2"
+            "1bc3565e796b3ded6552f1b5a574a201c3b11018222806f9618d23d77fd02db8"
+            "79cf87fe24ed7ba11b3b108b559633db1f95c5121b28011aa4dd20399bd4978e"
+            "1f8b8880c333a47ff1750679bf28d329347b26d347aae90ee562ae8029579cbe"
+            "0336e066d6b8ba5e0169fec804c30189a4434c1bf8a5b0a249951d3d89554da3"
+            "8ff0751b8b1fef9ae18a0aa2bc477736d199a06f61d400039a4cc03869bb10ca"
+        ),
+    },
+]
+
+
+def _instantiate(vector, **kwargs) -> HashDRBG:
+    return HashDRBG(vector["hash"], personalization=bytes.fromhex(vector["personalization"]),
+                    entropy_input=bytes.fromhex(vector["entropy"]), nonce=bytes.fromhex(vector["nonce"]), **kwargs)
+
+
+@pytest.mark.parametrize("vector", VECTORS, ids=lambda v: f"{v['hash']}-{'reseed' if 'entropy_reseed' in v else 'no-reseed'}"
+                         f"-{'addin' if v['additional_1'] else 'plain'}")
+def test_cavp_vector(vector):
+    drbg = _instantiate(vector)
+    if "entropy_reseed" in vector:
+        drbg.reseed(bytes.fromhex(vector["additional_reseed"]), bytes.fromhex(vector["entropy_reseed"]))
+    returned = bytes.fromhex(vector["returned"])
+    drbg.generate(len(returned), bytes.fromhex(vector["additional_1"]))
+    assert drbg.generate(len(returned), bytes.fromhex(vector["additional_2"])) == returned
+
+
+@pytest.mark.parametrize("vector", [v for v in VECTORS if "entropy_reseed" in v and v["additional_1"]],
+                         ids=lambda v: v["hash"])
+def test_prediction_resistance_reseeds_before_every_request(vector, monkeypatch):
+    # With prediction resistance each generate(additional_input) is reseed(fresh entropy, additional_input)
+    # followed by a generate without additional input; replay that against the vector-checked primitives.
+    entropy = [bytes.fromhex(vector["entropy_reseed"]), bytes.fromhex(vector["entropy"])]
+    returned = len(vector["returned"]) // 2
+    expected = _instantiate(vector)
+    outputs = []
+    for value, additional in zip(entropy, ("additional_1", "additional_2")):
+        expected.reseed(bytes.fromhex(vector[additional]), value)
+        outputs.append(expected.generate(returned))
+
+    drbg = _instantiate(vector, prediction_resistance=True)
+    supplied = iter(entropy)
+    monkeypatch.setattr(password_generator.os, "urandom", lambda n: next(supplied))
+    assert [drbg.generate(returned, bytes.fromhex(vector[a])) for a in ("additional_1", "additional_2")] == outputs
+    assert drbg.reseed_count == 2
+
+
+def test_reseed_interval_forces_reseed():
+    vector = VECTORS[0]
+    drbg = _instantiate(vector, reseed_interval=2)
+    for _ in range(5):
+        drbg.read(64)
+    assert drbg.reseed_count == 2
+    assert drbg.reseed_counter == 2
+
+
+def test_self_test_passes():
+    HashDRBG.self_test()
@@ -0,0 +1,8 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_model_imports_without_qt():
+    code = "import sys, password_generator; assert not any(m.startswith('PyQt6') for m in sys.modules)"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1])
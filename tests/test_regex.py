@@ -0,0 +1,59 @@
+import itertools
+import re
+import string
+from collections import Counter
+
+import pytest
+
+from password_generator import PasswordGenerator, PasswordRegex
+
+PRINTABLE = string.ascii_uppercase + string.ascii_lowercase + string.digits + string.punctuation
+
+# Patterns that can only match digits, so enumerating digit strings finds every match
+DIGIT_PATTERNS = [r"\d{2,3}", r"(12|3)*4?", r"[0-4]+[5-9]", r"1?2*3+", r"(?:0|1(01*0)*1)+", r"^[^\D5]{1,4}$"]
+MIXED_PATTERNS = [r".", r"\w\W", r"[a-c\-]+", r"(a|b|)*", r"[^a-z].?", r"\\.|\.\d"]
+
+
+def _enumerate(pattern, alphabet, length):
+    return sum(1 for chars in itertools.product(alphabet, repeat=length) if re.fullmatch(pattern, "".join(chars)))
+
+
+@pytest.mark.parametrize("pattern", DIGIT_PATTERNS)
+@pytest.mark.parametrize("length", range(0, 5))
+def test_count_matches_enumeration_on_digits(pattern, length):
+    assert PasswordRegex(pattern).count(length) == _enumerate(pattern, string.digits, length)
+
+
+@pytest.mark.parametrize("pattern", MIXED_PATTERNS)
+@pytest.mark.parametrize("length", range(0, 3))
+def test_count_matches_enumeration_on_printable(pattern, length):
+    assert PasswordRegex(pattern).count(length) == _enumerate(pattern, PRINTABLE, length)
+
+
+@pytest.mark.parametrize("pattern, length", [(r"[A-Z][a-z]{3,6}\d{2,4}[!@#$%^&*]", 12),
+                                             (r"(?:[a-z]{4}-){3}\d{2}", 17), (r"\w*\d\w*", 8)])
+def test_sampled_passwords_match(pattern, length):
+    for password in PasswordGenerator.generate_many_matching(2000, pattern, length):
+        assert len(password) == length and re.fullmatch(pattern, password)
+
+
+def test_sampling_is_uniform_over_matches():
+    # Ambiguous alternation: uniform over distinct strings, not over regex paths
+    pattern, length = r"(ab|a)*[12]", 4
+    samples = 60_000
+    counter = Counter(PasswordGenerator.generate_many_matching(samples, pattern, length))
+    outcomes = PasswordRegex(pattern).count(length)
+    assert len(counter) == outcomes == 6
+    expected = samples / outcomes
+    assert all(abs(n - expected) < 6 * expected ** 0.5 for n in counter.values())
+
+
+@pytest.mark.parametrize("pattern", ["a**(", "[a", "a{3,1}", "\\q", "a^b", "é", "*a", "(a"])
+def test_unsupported_patterns_are_rejected(pattern):
+    with pytest.raises(ValueError):
+        PasswordRegex(pattern)
+
+
+def test_unmatchable_length_is_rejected():
+    with pytest.raises(ValueError):
+        PasswordGenerator.generate_matching("abc", 2)
@@ -0,0 +1,40 @@
+import pytest
+
+import password_generator
+from password_generator import PasswordPolicy, PasswordReservoir
+
+
+@pytest.mark.parametrize("policy", [
+    PasswordPolicy(length=0),
+    PasswordPolicy(8, False, False, False, False),
+    PasswordPolicy(2, require_each_class=True),
+])
+def test_unusable_policies_are_rejected_up_front(policy):
+    with pytest.raises(ValueError):
+        PasswordReservoir(policy)
+
+
+def test_refill_errors_surface_in_pop(monkeypatch):
+    calls = []
+    sample_policy = password_generator._sample_policy
+
+    def fail_after_probe(policy, count, source=None):
+        calls.append(count)
+        if len(calls) > 1:
+            raise OSError("entropy source unavailable")
+        return sample_policy(policy, count, source)
+
+    monkeypatch.setattr(password_generator, "_sample_policy", fail_after_probe)
+    reservoir = PasswordReservoir(PasswordPolicy(12), capacity=8)
+    reservoir._thread.join(timeout=5)
+    with pytest.raises(RuntimeError) as info:
+        reservoir.pop()
+    assert isinstance(info.value.__cause__, OSError)
+    reservoir.close()
+
+
+def test_pop_serves_policy_passwords():
+    with PasswordReservoir(PasswordPolicy(10), capacity=16) as reservoir:
+        passwords = [reservoir.pop() for _ in range(40)]
+    assert all(len(p) == 10 for p in passwords)
+    assert reservoir.hits + reservoir.misses == 40
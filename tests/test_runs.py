@@ -0,0 +1,73 @@
+import itertools
+import string
+from collections import Counter
+
+import pytest
+
+from password_generator import PasswordGenerator, PasswordPolicy, _run_plan
+
+CLASSES = (string.ascii_uppercase, string.ascii_lowercase, string.digits, string.punctuation)
+
+
+def _same_class(a: str, b: str) -> bool:
+    return any(a in letters and b in letters for letters in CLASSES)
+
+
+def _valid(password: str, max_repeat: int | None, max_sequence: int | None) -> bool:
+    repeat = run = 1
+    for previous, char in zip(password, password[1:]):
+        repeat = repeat + 1 if char == previous else 1
+        run = run + 1 if ord(char) == ord(previous) + 1 and _same_class(previous, char) else 1
+        if (max_repeat is not None and repeat > max_repeat) or (max_sequence is not None and run > max_sequence):
+            return False
+    return True
+
+
+LIMITS = [(1, None), (2, None), (None, 1), (None, 2), (2, 2), (3, 1), (1, 3)]
+ALPHABETS = {
+    "digits": (False, False, True, False),
+    "symbols": (False, False, False, True),
+    "digits+symbols": (False, False, True, True),
+}
+
+
+@pytest.mark.parametrize("max_repeat, max_sequence", LIMITS)
+@pytest.mark.parametrize("name", ALPHABETS)
+@pytest.mark.parametrize("length", range(1, 4))
+def test_plan_total_matches_enumeration(max_repeat, max_sequence, name, length):
+    policy = PasswordPolicy(length, *ALPHABETS[name], max_repeat=max_repeat, max_sequence=max_sequence)
+    alphabet = policy.charset.alphabet
+    expected = sum(_valid("".join(chars), max_repeat, max_sequence)
+                   for chars in itertools.product(alphabet, repeat=length))
+    assert _run_plan(policy.charset, max_repeat, max_sequence, length).total == expected
+
+
+@pytest.mark.parametrize("pair", ["/:", "@[", "`{", "Z[", "9:", "z{"])
+def test_non_adjacent_neighbours_are_not_sequences(pair):
+    charset = PasswordPolicy(2, max_sequence=1).charset
+    succ = _run_plan(charset, None, 1, 2).succ
+    first, second = (charset.alphabet.index(c) for c in pair)
+    assert succ[first] != second
+
+
+@pytest.mark.parametrize("max_repeat, max_sequence", LIMITS)
+def test_sampled_passwords_respect_limits(max_repeat, max_sequence):
+    policy = PasswordPolicy(64, max_repeat=max_repeat, max_sequence=max_sequence)
+    for password in PasswordGenerator.generate_stream(policy, 500):
+        assert len(password) == 64 and _valid(password, max_repeat, max_sequence)
+
+
+@pytest.mark.parametrize("max_repeat, max_sequence", [(2, 2), (1, 3)])
+def test_sampling_is_uniform(max_repeat, max_sequence):
+    policy = PasswordPolicy(3, False, False, True, False, max_repeat=max_repeat, max_sequence=max_sequence)
+    outcomes = _run_plan(policy.charset, max_repeat, max_sequence, 3).total
+    samples = 100 * outcomes
+    counter = Counter(PasswordGenerator.generate_stream(policy, samples))
+    assert len(counter) == outcomes
+    statistic = sum((n - 100) ** 2 / 100 for n in counter.values())
+    assert statistic < outcomes + 6 * (2 * outcomes) ** 0.5
+
+
+def test_limits_cannot_be_combined_with_class_requirements():
+    with pytest.raises(ValueError):
+        PasswordPolicy(max_repeat=2, require_each_class=True)
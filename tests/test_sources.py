@@ -0,0 +1,9 @@
+from password_generator import ShakeDRBG
+
+
+def test_shake_drbg_wipes_returned_bytes():
+    drbg = ShakeDRBG(block_size=4096)
+    first = drbg.read(100)
+    second = drbg.read(100)
+    assert first != second
+    assert drbg._block[:200] == bytes(200)
@@ -0,0 +1,75 @@
+import string
+from collections import Counter
+
+import pytest
+
+from password_generator import PasswordGenerator, PasswordTemplate
+
+PRINTABLE = string.ascii_uppercase + string.ascii_lowercase + string.digits + string.punctuation
+CLASSES = {"A": string.ascii_uppercase, "a": string.ascii_lowercase, "9": string.digits,
+           "s": string.punctuation, "*": PRINTABLE}
+
+# Template -> what each position may hold, one entry per character of the password
+LAYOUTS = {
+    "Aaaa-9999-ssss": ["A", "a", "a", "a", "-", "9", "9", "9", "9", "-", "s", "s", "s", "s"],
+    "A{2}a{3}9": ["A", "A", "a", "a", "a", "9"],
+    r"\A\9\\*": [r"\A", r"\9", "\\\\", "*"],
+    "x{3}-*{0}9": ["x", "x", "x", "-", "9"],
+    "s*{2}": ["s", "*", "*"],
+}
+
+
+def _allowed(code):
+    """Characters position code `code` may produce: a class, or one literal (escaped or not)."""
+    if code.startswith("\\"):
+        return code[1:]
+    return CLASSES.get(code, code)
+
+
+@pytest.mark.parametrize("template, layout", LAYOUTS.items())
+def test_parsing_expands_codes_escapes_and_repeats(template, layout):
+    compiled = PasswordTemplate(template)
+    assert compiled.length == len(layout)
+    space = 1
+    for code in layout:
+        space *= len(_allowed(code))
+    assert compiled.space == space
+
+
+@pytest.mark.parametrize("template, layout", LAYOUTS.items())
+def test_every_position_follows_the_template(template, layout):
+    passwords = [PasswordGenerator.generate_from_template(template) for _ in range(200)]
+    passwords += PasswordGenerator.generate_many_from_template(2000, template)
+    for password in passwords:
+        assert len(password) == len(layout)
+        assert all(char in _allowed(code) for char, code in zip(password, layout))
+
+
+def test_empty_template():
+    assert PasswordTemplate("").length == 0
+    assert PasswordGenerator.generate_from_template("9{0}") == ""
+    assert PasswordGenerator.generate_many_from_template(3, "") == ["", "", ""]
+
+
+@pytest.mark.parametrize("template", ["{2}", "a{", "a{x}", "a{-1}", "a{2}{2}", "\\", "a\\", "é", "a\tb", "*{999999999}"])
+def test_invalid_templates_are_rejected(template):
+    with pytest.raises(ValueError):
+        PasswordTemplate(template)
+
+
+def test_length_bound():
+    assert PasswordTemplate(f"*{{{PasswordTemplate.MAX_LENGTH}}}").length == PasswordTemplate.MAX_LENGTH
+    with pytest.raises(ValueError):
+        PasswordTemplate("a" * (PasswordTemplate.MAX_LENGTH + 1))
+
+
+@pytest.mark.parametrize("draw", [
+    lambda samples: [PasswordGenerator.generate_from_template("9-9") for _ in range(samples)],  # Mixed radix
+    lambda samples: PasswordGenerator.generate_many_from_template(samples, "9-9"),  # Strided batch fill
+])
+def test_sampling_is_uniform(draw):
+    samples = 30_000
+    counter = Counter(draw(samples))
+    assert len(counter) == PasswordTemplate("9-9").space == 100
+    expected = samples / 100
+    assert all(abs(n - expected) < 6 * expected ** 0.5 for n in counter.values())